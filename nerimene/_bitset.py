@@ -0,0 +1,78 @@
+# src/_bitset.py
+import numpy as np
+
+
+def n_words(n_bits: int) -> int:
+    """Number of uint64 words needed for n_bits bits"""
+    return (n_bits + 63) >> 6
+
+
+def csr_row_words(indptr: np.ndarray, indices: np.ndarray):
+    """
+    Per-row bitset form of a CSR 0/1 matrix.
+    Returns: (word_ptr, words, masks)
+    - row r sets bits masks[word_ptr[r]:word_ptr[r+1]] in words words[word_ptr[r]:word_ptr[r+1]]
+    - column index i lives in word i >> 6 at bit i & 63; columns of a row that
+      share a word are OR-merged into one mask
+    """
+    n_rows = len(indptr) - 1
+    rows = np.repeat(np.arange(n_rows, dtype=np.int64), np.diff(indptr))
+    cols = np.asarray(indices, dtype=np.int64)
+    if cols.size == 0:
+        return (np.zeros(n_rows + 1, dtype=np.int32), np.empty(0, dtype=np.int32),
+                np.empty(0, dtype=np.uint64))
+
+    # sort the entries by (row, word) so each run of equal keys is one mask
+    word = cols >> 6
+    key = rows * (int(word.max()) + 1) + word
+    order = np.argsort(key, kind='stable')
+    key = key[order]
+    bits = np.left_shift(np.uint64(1), (cols[order] & 63).astype(np.uint64))
+
+    starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+    masks = np.bitwise_or.reduceat(bits, starts)
+    # word numbers fit int32 for any n_bits < 2**37, so store them narrow:
+    # the greedy streams this array on every pick
+    words = word[order][starts].astype(np.int32)
+    word_ptr = np.zeros(n_rows + 1, dtype=np.int32 if starts.size < 2 ** 31 else np.int64)
+    np.cumsum(np.bincount(rows[order][starts], minlength=n_rows), out=word_ptr[1:])
+    return word_ptr, words, masks
+
+
+def dense_rows(indptr: np.ndarray, indices: np.ndarray, n_bits: int) -> np.ndarray:
+    """
+    Dense (n_rows, n_words(n_bits)) uint64 bit matrix of a CSR 0/1 matrix,
+    same bit layout as csr_row_words. Rows are packed a block at a time
+    through a boolean scratch of about 8 MB.
+    """
+    n_rows = len(indptr) - 1
+    width = n_words(n_bits) * 64
+    bitmat = np.zeros((n_rows, width >> 6), dtype=np.uint64)
+    block = max(1, (1 << 23) // max(width, 1))
+    scratch = np.zeros((min(block, n_rows), width), dtype=bool)
+    for start in range(0, n_rows, block):
+        stop = min(start + block, n_rows)
+        dense = scratch[:stop - start]
+        dense[:] = False
+        local_rows = np.repeat(np.arange(stop - start), np.diff(indptr[start:stop + 1]))
+        dense[local_rows, indices[indptr[start]:indptr[stop]]] = True
+        bitmat[start:stop] = np.packbits(dense, axis=1, bitorder='little').view('<u8')
+    return bitmat
+
+
+# popcount of every byte value, for NumPy < 2.0 (no np.bitwise_count)
+_BYTE_POPCOUNT = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+
+
+def popcount_rows(bitmat: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a 2-D uint64 bit matrix (int64)"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(bitmat).sum(axis=1, dtype=np.int64)
+    as_bytes = np.ascontiguousarray(bitmat).view(np.uint8)
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=1, dtype=np.int64)
+
+
+def unpack(bitset: np.ndarray, n_bits: int) -> np.ndarray:
+    """Boolean array of the first n_bits bits of a uint64 bitset"""
+    as_bytes = bitset.astype('<u8', copy=False).view(np.uint8)
+    return np.unpackbits(as_bytes, count=n_bits, bitorder='little').astype(bool)
@@ -0,0 +1,35 @@
+# src/_frames.py
+import numpy as np
+import pandas as pd
+
+
+def numeric(column: pd.Series) -> np.ndarray:
+    """
+    float64 values of a column, missing or non-numeric entries as NaN.
+    Numeric columns are read directly (possibly a read-only view); only
+    object/string columns go through pd.to_numeric.
+    """
+    if column.dtype.kind in 'biuf':
+        return column.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.asarray(pd.to_numeric(column, errors='coerce'), dtype=np.float64)
+
+
+def population_weights(population: pd.DataFrame) -> np.ndarray:
+    """Population weights from column 'pop' (default 1), missing ones as 0"""
+    if 'pop' not in population.columns:
+        return np.ones(len(population), dtype=np.float64)
+    weights = numeric(population['pop'])
+    missing = np.isnan(weights)
+    if missing.any():
+        weights = np.where(missing, 0.0, weights)
+    return weights
+
+
+def coordinates(frame: pd.DataFrame) -> np.ndarray:
+    """
+    (n, 2) C-contiguous float64 array of the 'x', 'y' columns.
+    Coordinates stay float64, unlike the weights the solvers may narrow:
+    cKDTree computes in float64 regardless, and rounding them would move
+    points across the radius boundary.
+    """
+    return np.ascontiguousarray(np.column_stack((numeric(frame['x']), numeric(frame['y']))))
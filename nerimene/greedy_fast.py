@@ -1,8 +1,14 @@
 # src/greedy_fast.py
 import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix
 from scipy.spatial import cKDTree
 from typing import List, Tuple
+from itertools import chain
+
+from ._bitset import csr_row_words, dense_rows, popcount_rows, unpack
+from ._frames import coordinates, population_weights
+from .greedy_fast_numba import NUMBA_AVAILABLE, _lazy_greedy
 
 def greedy_max_k_cover_fast(candidates: pd.DataFrame, population: pd.DataFrame,
                             k: int, radius: float) -> Tuple[List[int], float, np.ndarray]:
@@ -13,65 +19,118 @@ def greedy_max_k_cover_fast(candidates: pd.DataFrame, population: pd.DataFrame,
     - total_covered_pop : sum of population weights covered
     - covered_mask : boolean array length n_pop showing which population points are covered
     """
-    # defensive copy / reset index
-    candidates = candidates.reset_index(drop=True).copy()
-    population = population.reset_index(drop=True).copy()
-
-    # ensure numeric coords
+    # work on plain arrays: the DataFrames are read once and never modified
     for col in ('x','y'):
         if col not in candidates.columns or col not in population.columns:
             raise ValueError(f"Both candidates and population must contain column '{col}'")
-        candidates[col] = pd.to_numeric(candidates[col], errors='coerce')
-        population[col] = pd.to_numeric(population[col], errors='coerce')
-
-    # population weights default to 1
-    if 'pop' not in population.columns:
-        population['pop'] = 1.0
-    population['pop'] = pd.to_numeric(population['pop'], errors='coerce').fillna(0.0)
 
     n_cand = len(candidates)
     n_pop = len(population)
+    pop_weights = population_weights(population)
+
     if n_cand == 0 or n_pop == 0 or k <= 0:
         return [], 0.0, np.zeros(n_pop, dtype=bool)
 
-    pop_coords = np.column_stack((population['x'].values, population['y'].values))
-    cand_coords = np.column_stack((candidates['x'].values, candidates['y'].values))
-    pop_weights = population['pop'].values.astype(float)
+    # integer weights are summed exactly in float64 below 2**53, and in float32
+    # below 2**24: narrow the weights and the coverage matrix to float32 then,
+    # which halves the bytes every gain computation streams without changing
+    # a single pick
+    weight_total = float(np.abs(pop_weights).sum())
+    integer_weights = np.array_equal(pop_weights, np.round(pop_weights))
+    if integer_weights and weight_total < 2.0 ** 24:
+        pop_weights = pop_weights.astype(np.float32)
+
+    # coordinates stay float64 (see _frames.coordinates)
+    pop_coords = coordinates(population)
+    cand_coords = coordinates(candidates)
 
     tree = cKDTree(pop_coords)
-    # list of arrays of pop-indices that each candidate covers
-    coverage_lists = [np.array(tree.query_ball_point(pt, r=radius), dtype=int) for pt in cand_coords]
+    # pop-indices that each candidate covers, from one batched (multi-threaded) query
+    coverage_lists = tree.query_ball_point(cand_coords, r=radius, workers=-1, return_sorted=False)
 
-    covered = np.zeros(n_pop, dtype=bool)
-    selected_indices = []
-    selected_ids = []
+    # sparse candidate x population coverage matrix: row ci has a 1 for every
+    # population point candidate ci covers
+    lengths = np.fromiter(map(len, coverage_lists), dtype=np.intp, count=n_cand)
+    row_ind = np.repeat(np.arange(n_cand, dtype=np.int32), lengths)
+    col_ind = np.fromiter(chain.from_iterable(coverage_lists), dtype=np.int32, count=int(lengths.sum()))
+    coverage = csr_matrix((np.ones(col_ind.size, dtype=pop_weights.dtype), (row_ind, col_ind)),
+                          shape=(n_cand, n_pop))
 
-    for _ in range(min(k, n_cand)):
-        best_ci = -1
-        best_gain = 0.0
-        for ci, cov in enumerate(coverage_lists):
-            if ci in selected_indices:
-                continue
-            if cov.size == 0:
-                continue
-            # which indices of population are not yet covered
-            uncov = cov[~covered[cov]]
-            if uncov.size == 0:
-                continue
-            gain = pop_weights[uncov].sum()
-            if gain > best_gain:
-                best_gain = gain
-                best_ci = ci
-        if best_ci == -1:
-            break
-        selected_indices.append(best_ci)
-        # candidate id from column 'id' (cast to int if possible)
-        try:
-            selected_ids.append(int(candidates.iloc[best_ci]['id']))
-        except Exception:
-            selected_ids.append(candidates.iloc[best_ci]['id'])
-        # mark newly covered population points
-        covered[coverage_lists[best_ci]] = True
+    if NUMBA_AVAILABLE and pop_weights.min() >= 0.0:
+        # compiled lazy greedy: only stale top-of-heap gains get recomputed.
+        # Stale gains are upper bounds only for non-negative weights
+        word_ptr, words, masks = csr_row_words(coverage.indptr, coverage.indices)
+        selected, covered_bits = _lazy_greedy(coverage.indptr, coverage.indices,
+                                              word_ptr, words, masks,
+                                              pop_weights, n_cand, int(k))
+        selected_indices = selected.tolist()
+        covered = unpack(covered_bits, n_pop)
+    elif (coverage.nnz > n_cand * (n_pop // 16)
+          and pop_weights[0] > 0.0 and np.all(pop_weights == pop_weights[0])):
+        # dense coverage with equal weights: a candidate's gain is the number of
+        # uncovered points it reaches, so AND + popcount whole uint64 words
+        # instead of a sparse mat-vec. Above 1 point in 16 per candidate a
+        # word scan is measurably cheaper than the CSR walk and pays for
+        # packing the bit matrix within a few picks.
+        bitmat = dense_rows(coverage.indptr, coverage.indices, n_pop)
+        covered_bits = np.zeros(bitmat.shape[1], dtype=np.uint64)
+        selected_indices = []
+
+        for _ in range(min(k, n_cand)):
+            counts = popcount_rows(bitmat & ~covered_bits)
+            counts[selected_indices] = -1
+            best_ci = int(np.argmax(counts))  # first maximum, as in a linear scan
+            if not counts[best_ci] > 0:
+                break
+            selected_indices.append(best_ci)
+            covered_bits |= bitmat[best_ci]
+        covered = unpack(covered_bits, n_pop)
+    elif integer_weights and weight_total < 2.0 ** 53:
+        # integer weights: keep every candidate's gain cached and, after a pick,
+        # subtract the newly covered weight from the candidates that reach those
+        # points only (inverse index = CSC). Integer sums below 2**53 are exact
+        # in float64, so this picks exactly what the full recompute would.
+        covering = coverage.tocsc()
+        gains = coverage @ pop_weights
+        covered = np.zeros(n_pop, dtype=bool)
+        selected_indices = []
+
+        for _ in range(min(k, n_cand)):
+            best_ci = int(np.argmax(gains))  # first maximum, as in a linear scan
+            if not gains[best_ci] > 0.0:
+                break
+            selected_indices.append(best_ci)
+            reach = coverage.indices[coverage.indptr[best_ci]:coverage.indptr[best_ci + 1]]
+            newly = reach[~covered[reach]]
+            covered[newly] = True
+            gains -= covering[:, newly] @ pop_weights[newly]
+            gains[best_ci] = -np.inf
+    else:
+        covered = np.zeros(n_pop, dtype=bool)
+        selected_mask = np.zeros(n_cand, dtype=bool)
+        selected_indices = []
+
+        for _ in range(min(k, n_cand)):
+            # weight of the still-uncovered points each candidate would add
+            gains = coverage @ np.where(covered, 0.0, pop_weights)
+            gains[selected_mask] = -np.inf
+            best_ci = int(np.argmax(gains))  # first maximum, as in a linear scan
+            if not gains[best_ci] > 0.0:
+                break
+            selected_mask[best_ci] = True
+            selected_indices.append(best_ci)
+            # mark newly covered population points
+            covered[coverage_lists[best_ci]] = True
+
+    selected_ids = []
+    if selected_indices:
+        cand_ids = candidates['id'].to_numpy()
+        for cid in cand_ids[selected_indices]:
+            # candidate id from column 'id' (cast to int if possible)
+            try:
+                selected_ids.append(int(cid))
+            except Exception:
+                selected_ids.append(cid)
 
     total_covered = float(pop_weights[covered].sum())
     return selected_ids, total_covered, covered
@@ -0,0 +1,97 @@
+# src/greedy_fast_numba.py
+import numpy as np
+
+# numba is optional: without it the functions below still run as plain Python
+# (correct, but slow), and greedy_fast keeps its NumPy/scipy loop instead
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _before(gain_a, ci_a, gain_b, ci_b):
+    """Heap order: larger gain first, lower candidate index on ties"""
+    return gain_a > gain_b or (gain_a == gain_b and ci_a < ci_b)
+
+
+@njit(cache=True)
+def _sift_down(heap_gain, heap_ci, heap_iter, pos, size):
+    while True:
+        left = 2 * pos + 1
+        if left >= size:
+            return
+        best = left
+        right = left + 1
+        if right < size and _before(heap_gain[right], heap_ci[right],
+                                    heap_gain[left], heap_ci[left]):
+            best = right
+        if not _before(heap_gain[best], heap_ci[best], heap_gain[pos], heap_ci[pos]):
+            return
+        heap_gain[pos], heap_gain[best] = heap_gain[best], heap_gain[pos]
+        heap_ci[pos], heap_ci[best] = heap_ci[best], heap_ci[pos]
+        heap_iter[pos], heap_iter[best] = heap_iter[best], heap_iter[pos]
+        pos = best
+
+
+@njit(cache=True)
+def _lazy_greedy(indptr, indices, word_ptr, words, masks, pop_weights, n_cand, k):
+    """
+    Lazy (Minoux) greedy max-k-cover over a CSR candidate x population matrix.
+    (word_ptr, words, masks) is the same matrix in _bitset.csr_row_words form.
+    Returns: (selected candidate row indices in pick order, covered bitset)
+    Picks the same candidates as a full scan: largest positive gain, lowest
+    index on ties. pop_weights must be non-negative, or stale gains are not
+    upper bounds and the picks can differ.
+    """
+    # covered population points as a uint64 bitset (point i = bit i & 63 of word i >> 6)
+    covered = np.zeros((pop_weights.shape[0] + 63) >> 6, dtype=np.uint64)
+    selected = np.empty(min(k, n_cand), dtype=np.int64)
+    n_selected = 0
+
+    # max-heap of (upper bound on gain, candidate, iteration the bound is from)
+    heap_gain = np.empty(n_cand, dtype=np.float64)
+    heap_ci = np.empty(n_cand, dtype=np.int64)
+    heap_iter = np.zeros(n_cand, dtype=np.int64)
+    for ci in range(n_cand):
+        g = 0.0
+        for j in range(indptr[ci], indptr[ci + 1]):
+            g += pop_weights[indices[j]]
+        heap_gain[ci] = g
+        heap_ci[ci] = ci
+    size = n_cand
+    for pos in range(size // 2 - 1, -1, -1):
+        _sift_down(heap_gain, heap_ci, heap_iter, pos, size)
+
+    while n_selected < selected.shape[0] and size > 0:
+        ci = heap_ci[0]
+        if heap_iter[0] == n_selected:
+            # bound is exact for the current coverage, so this is the best pick
+            if not heap_gain[0] > 0.0:
+                break
+            selected[n_selected] = ci
+            n_selected += 1
+            for w in range(word_ptr[ci], word_ptr[ci + 1]):
+                covered[words[w]] |= masks[w]
+            size -= 1
+            heap_gain[0] = heap_gain[size]
+            heap_ci[0] = heap_ci[size]
+            heap_iter[0] = heap_iter[size]
+        else:
+            # stale bound: recompute the gain and let it sink to its place
+            g = 0.0
+            for j in range(indptr[ci], indptr[ci + 1]):
+                i = indices[j]
+                if not (covered[i >> 6] >> np.uint64(i & 63)) & np.uint64(1):
+                    g += pop_weights[i]
+            heap_gain[0] = g
+            heap_iter[0] = n_selected
+        _sift_down(heap_gain, heap_ci, heap_iter, 0, size)
+
+    return selected[:n_selected], covered
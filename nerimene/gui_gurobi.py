@@ -1,17 +1,184 @@
 # src/gui_gurobi.py
 import sys, os
+import numpy as np
 import pandas as pd
 from PyQt6 import QtWidgets
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
-import matplotlib
-# ensure using Qt backend
-matplotlib.use("QtAgg")
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
+# pyqtgraph (optional, see requirements.txt) draws large point clouds
+# interactively; without it the plot falls back to matplotlib
+try:
+    import pyqtgraph as pg
+    PYQTGRAPH_AVAILABLE = True
+except Exception:
+    PYQTGRAPH_AVAILABLE = False
+    import matplotlib
+    # ensure using Qt backend
+    matplotlib.use("QtAgg")
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 from .gurobi_maxkcover import solve_max_k_coverage_with_gurobi
 from .greedy_fast import greedy_max_k_cover_fast
 
+
+class SolveSignals(QObject):
+    """Signals of a SolveWorker"""
+    finished = pyqtSignal(list, float, object, str)  # selected_ids, total_cov, covered_mask, method
+    failed = pyqtSignal(str)
+    status = pyqtSignal(str)
+
+
+class SolveWorker(QRunnable):
+    """Solves one instance on the global thread pool: Gurobi first, greedy as fallback"""
+    def __init__(self, signals: SolveSignals, candidates, population, k, radius):
+        super().__init__()
+        self.signals = signals
+        self.candidates = candidates
+        self.population = population
+        self.k = k
+        self.radius = radius
+
+    def run(self):
+        covered_mask = None
+        try:
+            # Try Gurobi first
+            try:
+                selected_ids, total_cov, model = solve_max_k_coverage_with_gurobi(self.candidates, self.population, self.k, self.radius)
+                method = "Gurobi (exact)"
+                # model may be None if not solved; it's okay
+            except Exception as e:
+                # fallback to greedy, capture exception text in status
+                self.signals.status.emit(f"Gurobi failed or not available: {str(e)} — using greedy")
+                selected_ids, total_cov, covered_mask = greedy_max_k_cover_fast(self.candidates, self.population, self.k, self.radius)
+                method = "Greedy fallback"
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(list(selected_ids), float(total_cov), covered_mask, method)
+
+
+class PgPlot:
+    """
+    pyqtgraph view of the instance: cached scatter items for population and
+    candidates, plain graphics ellipses for the selection circles.
+    """
+    def __init__(self):
+        self.widget = pg.PlotWidget(background='w')
+        self.widget.setLabel('bottom', "x")
+        self.widget.setLabel('left', "y")
+        self._legend = self.widget.addLegend(offset=(10, 10))
+        # same colours as matplotlib's default cycle (C0, C1)
+        self._pop_item = pg.ScatterPlotItem(size=6, pen=None, brush=pg.mkBrush(31, 119, 180, 153),
+                                            useCache=True)
+        self._cand_item = pg.ScatterPlotItem(size=9, symbol='s', pen=None, brush=pg.mkBrush(255, 127, 14),
+                                             useCache=True)
+        self.widget.addItem(self._pop_item)
+        self.widget.addItem(self._cand_item)
+        self._selection_items = []
+
+    def set_points(self, pop_xy, cand_xy):
+        """Show population / candidate coordinates ((n,2) arrays or None) and drop any selection"""
+        self.clear_selection()
+        self._legend.clear()
+        for item, xy, name in ((self._pop_item, pop_xy, 'population'), (self._cand_item, cand_xy, 'candidates')):
+            if xy is not None:
+                item.setData(x=xy[:, 0], y=xy[:, 1])
+                self._legend.addItem(item, name)
+            else:
+                item.clear()
+        self.widget.enableAutoRange()
+
+    def show_selection(self, centers, radius, limits=None):
+        """Draw the selected candidates with two concentric circles each"""
+        self.clear_selection()
+        outer_pen = pg.mkPen('r', width=1.2)
+        inner_pen = pg.mkPen('r', width=0.8, style=pg.QtCore.Qt.PenStyle.DashLine)
+        for cx, cy in centers:
+            for r, pen in ((radius, outer_pen), (radius * 0.6, inner_pen)):
+                circle = pg.QtWidgets.QGraphicsEllipseItem(cx - r, cy - r, 2 * r, 2 * r)
+                circle.setPen(pen)
+                self.widget.addItem(circle)
+                self._selection_items.append(circle)
+        if centers:
+            xs, ys = zip(*centers)
+            markers = pg.ScatterPlotItem(x=xs, y=ys, size=10, pen=None, brush='r')
+            self.widget.addItem(markers)
+            self._selection_items.append(markers)
+        if limits is not None:
+            xmin, xmax, ymin, ymax = limits
+            self.widget.setRange(xRange=(xmin, xmax), yRange=(ymin, ymax), padding=0)
+
+    def clear_selection(self):
+        for item in self._selection_items:
+            self.widget.removeItem(item)
+        self._selection_items.clear()
+
+
+class MplPlot:
+    """
+    matplotlib view of the instance: persistent scatters updated through their
+    offsets, selection artists replaced on each solve, idle redraws.
+    """
+    def __init__(self):
+        self.fig, self.ax = plt.subplots(figsize=(6,4))
+        self.widget = FigureCanvas(self.fig)
+        self._pop_artist = self.ax.scatter([], [], s=20, alpha=0.6, label='population')
+        self._cand_artist = self.ax.scatter([], [], marker='s', s=60, label='candidates')
+        self._selection_artists = []
+        self.ax.set_xlabel("x")
+        self.ax.set_ylabel("y")
+
+    def set_points(self, pop_xy, cand_xy):
+        """Show population / candidate coordinates ((n,2) arrays or None) and drop any selection"""
+        self.clear_selection()
+        shown = []
+        for artist, xy in ((self._pop_artist, pop_xy), (self._cand_artist, cand_xy)):
+            if xy is not None:
+                artist.set_offsets(xy)
+                shown.append(artist)
+            else:
+                artist.set_offsets(np.empty((0, 2)))
+        if shown:
+            self.ax.legend(handles=shown)
+        elif self.ax.get_legend():
+            self.ax.get_legend().remove()
+
+        # collections are not seen by relim(), so rebuild the data limits from the offsets
+        self.ax.ignore_existing_data_limits = True
+        for artist in shown:
+            self.ax.update_datalim(artist.get_offsets())
+        self.ax.set_autoscale_on(True)
+        self.ax.autoscale_view()
+        self.widget.draw_idle()
+
+    def show_selection(self, centers, radius, limits=None):
+        """Draw the selected candidates with two concentric circles each"""
+        self.clear_selection()
+        for cx, cy in centers:
+            # draw two concentric circles for visibility
+            circle1 = plt.Circle((cx, cy), radius, fill=False, edgecolor='red', linewidth=1.2)
+            circle2 = plt.Circle((cx, cy), radius*0.6, fill=False, edgecolor='red', linewidth=0.8, linestyle='--')
+            self._selection_artists.append(self.ax.add_patch(circle1))
+            self._selection_artists.append(self.ax.add_patch(circle2))
+        if centers:
+            # one marker collection for all selected candidates
+            xs, ys = zip(*centers)
+            self._selection_artists.append(self.ax.scatter(xs, ys, color='red', s=80))
+        if limits is not None:
+            xmin, xmax, ymin, ymax = limits
+            self.ax.set_xlim(xmin, xmax)
+            self.ax.set_ylim(ymin, ymax)
+        self.widget.draw_idle()
+
+    def clear_selection(self):
+        # remove the circles and markers of the previous solution
+        for artist in self._selection_artists:
+            artist.remove()
+        self._selection_artists.clear()
+
+
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
@@ -20,6 +187,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.candidates = None
         self.population = None
+        self._solve_inputs = None  # (candidates, population, radius) of the running solve
 
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
@@ -40,15 +208,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self.table = QtWidgets.QTableWidget()
         layout.addWidget(self.table, 1)
 
-        self.fig, self.ax = plt.subplots(figsize=(6,4))
-        self.canvas = FigureCanvas(self.fig)
-        layout.addWidget(self.canvas, 3)
+        self.plot = PgPlot() if PYQTGRAPH_AVAILABLE else MplPlot()
+        layout.addWidget(self.plot.widget, 3)
 
         self.btn_load_cand.clicked.connect(self.load_candidates)
         self.btn_load_pop.clicked.connect(self.load_population)
         self.btn_solve.clicked.connect(self.solve_problem)
 
-        self.statusBar().showMessage("Ready")
+        self.statusBar().showMessage("Ready" if PYQTGRAPH_AVAILABLE else
+                                     "Ready (matplotlib plot; install pyqtgraph for the interactive one)")
 
     def load_candidates(self):
         fn, _ = QFileDialog.getOpenFileName(self, "Open candidates CSV", "", "CSV Files (*.csv);;All Files (*)")
@@ -81,15 +249,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def refresh_plot(self):
         # Draw base plot only (no solution circles)
-        self.ax.clear()
-        if self.population is not None:
-            self.ax.scatter(self.population['x'], self.population['y'], s=20, alpha=0.6, label='population')
-        if self.candidates is not None:
-            self.ax.scatter(self.candidates['x'], self.candidates['y'], marker='s', s=60, label='candidates')
-        self.ax.legend()
-        self.ax.set_xlabel("x")
-        self.ax.set_ylabel("y")
-        self.canvas.draw()
+        self.plot.set_points(
+            self.population[['x','y']].to_numpy(dtype=float) if self.population is not None else None,
+            self.candidates[['x','y']].to_numpy(dtype=float) if self.candidates is not None else None)
 
     def solve_problem(self):
         if self.candidates is None or self.population is None:
@@ -100,21 +262,30 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_solve.setEnabled(False)
         self.statusBar().showMessage("Solving... (may take time)")
 
-        selected_ids = []
-        total_cov = 0.0
-        covered_mask = None
-        method = "None"
+        # solve off the GUI thread; results are drawn against the data they were computed on
+        self._solve_inputs = (self.candidates, self.population, radius)
+        signals = SolveSignals(self)
+        signals.status.connect(self.statusBar().showMessage)
+        signals.finished.connect(self._on_solve_done)
+        signals.failed.connect(self._on_solve_failed)
+        signals.finished.connect(signals.deleteLater)
+        signals.failed.connect(signals.deleteLater)
+        QThreadPool.globalInstance().start(SolveWorker(signals, self.candidates, self.population, k, radius))
 
-        # Try Gurobi first
-        try:
-            selected_ids, total_cov, model = solve_max_k_coverage_with_gurobi(self.candidates, self.population, k, radius)
-            method = "Gurobi (exact)"
-            # model may be None if not solved; it's okay
-        except Exception as e:
-            # fallback to greedy, capture exception text in status
-            self.statusBar().showMessage(f"Gurobi failed or not available: {str(e)} — using greedy")
-            selected_ids, total_cov, covered_mask = greedy_max_k_cover_fast(self.candidates, self.population, k, radius)
-            method = "Greedy fallback"
+    def _on_solve_failed(self, error):
+        self.statusBar().showMessage("Solve failed")
+        QMessageBox.critical(self, "Error", error)
+        self.btn_solve.setEnabled(True)
+
+    def _on_solve_done(self, selected_ids, total_cov, covered_mask, method):
+        candidates, population, radius = self._solve_inputs
+
+        # id -> (x, y) of the selected candidates' rows, built once instead of
+        # scanning the whole DataFrame per id (first row wins on duplicate ids)
+        cand_xy = {}
+        for cid, cx, cy in zip(candidates['id'].values,
+                               candidates['x'].values, candidates['y'].values):
+            cand_xy.setdefault(cid, (cx, cy))
 
         # Fill table with selected candidates
         self.table.clear()
@@ -123,57 +294,39 @@ class MainWindow(QtWidgets.QMainWindow):
         self.table.setHorizontalHeaderLabels(["rank","id","coords"])
         for i, cid in enumerate(selected_ids):
             try:
-                coords = self.candidates[self.candidates['id']==cid][['x','y']].iloc[0]
-                coord_text = f"{coords['x']:.3f}, {coords['y']:.3f}"
+                cx, cy = cand_xy[cid]
+                coord_text = f"{cx:.3f}, {cy:.3f}"
             except Exception:
                 coord_text = ""
             self.table.setItem(i,0, QtWidgets.QTableWidgetItem(str(i+1)))
             self.table.setItem(i,1, QtWidgets.QTableWidgetItem(str(cid)))
             self.table.setItem(i,2, QtWidgets.QTableWidgetItem(coord_text))
 
-        # Plot everything and circles
-        self.ax.clear()
-        if self.population is not None:
-            self.ax.scatter(self.population['x'], self.population['y'], s=20, alpha=0.6, label='population')
-        if self.candidates is not None:
-            self.ax.scatter(self.candidates['x'], self.candidates['y'], marker='s', s=60, label='candidates')
-
         # plot selected candidates and circles
-        for cid in selected_ids:
-            rows = self.candidates[self.candidates['id']==cid]
-            if rows.empty:
-                continue
-            row = rows.iloc[0]
-            cx, cy = float(row['x']), float(row['y'])
-            # draw two concentric circles for visibility
-            circle1 = plt.Circle((cx, cy), radius, fill=False, edgecolor='red', linewidth=1.2)
-            circle2 = plt.Circle((cx, cy), radius*0.6, fill=False, edgecolor='red', linewidth=0.8, linestyle='--')
-            self.ax.add_patch(circle1)
-            self.ax.add_patch(circle2)
-            self.ax.scatter([cx],[cy], color='red', s=80)
+        centers = [(float(cand_xy[cid][0]), float(cand_xy[cid][1])) for cid in selected_ids if cid in cand_xy]
 
-        self.ax.legend()
         # autoscale limits a bit to include circles
+        limits = None
         try:
             all_x = []
             all_y = []
-            if self.population is not None:
-                all_x += list(self.population['x'].values)
-                all_y += list(self.population['y'].values)
-            if self.candidates is not None:
-                all_x += list(self.candidates['x'].values)
-                all_y += list(self.candidates['y'].values)
+            if population is not None:
+                all_x += list(population['x'].values)
+                all_y += list(population['y'].values)
+            if candidates is not None:
+                all_x += list(candidates['x'].values)
+                all_y += list(candidates['y'].values)
             if all_x and all_y:
                 xmin, xmax = min(all_x), max(all_x)
                 ymin, ymax = min(all_y), max(all_y)
                 pad_x = max(1.0, (xmax - xmin) * 0.05)
                 pad_y = max(1.0, (ymax - ymin) * 0.05)
-                self.ax.set_xlim(xmin - pad_x - radius, xmax + pad_x + radius)
-                self.ax.set_ylim(ymin - pad_y - radius, ymax + pad_y + radius)
+                limits = (xmin - pad_x - radius, xmax + pad_x + radius,
+                          ymin - pad_y - radius, ymax + pad_y + radius)
         except Exception:
             pass
 
-        self.canvas.draw()
+        self.plot.show_selection(centers, radius, limits)
         self.statusBar().showMessage(f"Solved with {method}. Covered pop: {total_cov:.1f}")
         self.btn_solve.setEnabled(True)
 
@@ -1,9 +1,18 @@
 # src/gurobi_maxkcover.py
+import hashlib
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix
 from scipy.spatial import cKDTree
 
+from ._bitset import csr_row_words, unpack
+from ._frames import coordinates, population_weights
+from .greedy_fast_numba import NUMBA_AVAILABLE, _lazy_greedy
+
 # try import gurobi, but allow absence
 try:
     import gurobipy as gp
@@ -12,87 +21,246 @@ except Exception:
     gp = None
     GRB = None
 
-def build_coverage_lists(candidates_df: pd.DataFrame, population_df: pd.DataFrame, radius: float):
+# candidates per query_ball_point batch in build_coverage_lists
+QUERY_CHUNK = 4096
+# coverage results kept for repeated solves on the same points and radius (e.g. k sweeps)
+COVERAGE_CACHE_SIZE = 8
+
+_coverage_cache = OrderedDict()
+_coverage_cache_lock = threading.Lock()
+
+def build_coverage_lists(cand_coords: np.ndarray, pop_coords: np.ndarray, radius: float):
     """
+    cand_coords / pop_coords: (n, 2) float arrays of x, y
     Returns:
      - coverage_lists: list (len = n_cand) of numpy arrays of population indices covered by candidate j
-     - pop_to_cands: list (len = n_pop) of lists of candidate indices covering population point i
+     - pop_to_cands: CSR matrix (n_pop x n_cand); the candidates covering population point i are
+       pop_to_cands.indices[pop_to_cands.indptr[i]:pop_to_cands.indptr[i+1]], in increasing order
     """
-    pop_coords = np.column_stack((population_df['x'].values, population_df['y'].values))
-    cand_coords = np.column_stack((candidates_df['x'].values, candidates_df['y'].values))
-    tree = cKDTree(pop_coords)
-    coverage_lists = [np.array(tree.query_ball_point(pt, r=radius), dtype=int) for pt in cand_coords]
-    pop_to_cands = [[] for _ in range(len(pop_coords))]
-    for j, cov in enumerate(coverage_lists):
-        for i in cov:
-            pop_to_cands[i].append(j)
+    # sliding-midpoint (unbalanced, non-compacted) trees build faster and query
+    # as well on spatial point data; leaves of 32 points beat the default 16 by
+    # ~5-10% on radius queries (64 is no better)
+    pop_tree = cKDTree(pop_coords, leafsize=32, compact_nodes=False, balanced_tree=False)
+    # batched multi-threaded queries, a chunk of candidates at a time, so only
+    # two chunks' results exist as Python lists before becoming int32 arrays.
+    # The tree walk releases the GIL, so the next chunk is queried on a helper
+    # thread while this one is converted
+    def query(start):
+        return pop_tree.query_ball_point(cand_coords[start:start + QUERY_CHUNK], r=radius,
+                                         return_sorted=False, workers=-1)
+
+    coverage_lists = []
+    starts = range(0, len(cand_coords), QUERY_CHUNK)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(query, 0) if len(starts) > 1 else None
+        for n, start in enumerate(starts):
+            batch = pending.result() if pending is not None else query(start)
+            pending = pool.submit(query, starts[n + 1]) if n + 1 < len(starts) else None
+            coverage_lists.extend(np.asarray(cov, dtype=np.int32) for cov in batch)
+    # the lists laid end to end already are the candidate x population CSR
+    # (indptr = running lengths); its transpose converted to CSR is the
+    # inverse index, with the candidates of each point in increasing order
+    n_cand = len(coverage_lists)
+    indptr = np.zeros(n_cand + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, coverage_lists), dtype=np.int64, count=n_cand), out=indptr[1:])
+    pop_ids = np.concatenate(coverage_lists) if coverage_lists else np.empty(0, dtype=np.int32)
+    cand_to_pop = csr_matrix((np.ones(pop_ids.size, dtype=np.int8), pop_ids, indptr),
+                             shape=(n_cand, len(pop_coords)))
+    pop_to_cands = cand_to_pop.T.tocsr()
+    pop_to_cands.sort_indices()
     return coverage_lists, pop_to_cands
 
+def cached_coverage_lists(cand_coords: np.ndarray, pop_coords: np.ndarray, radius: float):
+    """
+    build_coverage_lists with an LRU cache of COVERAGE_CACHE_SIZE entries, keyed
+    on a digest of both coordinate arrays and the radius. The cached arrays
+    are shared between callers and must not be modified.
+    """
+    key = (hashlib.blake2b(np.ascontiguousarray(cand_coords)).digest(), cand_coords.shape,
+           hashlib.blake2b(np.ascontiguousarray(pop_coords)).digest(), pop_coords.shape, float(radius))
+    with _coverage_cache_lock:
+        if key in _coverage_cache:
+            _coverage_cache.move_to_end(key)
+            return _coverage_cache[key]
+    result = build_coverage_lists(cand_coords, pop_coords, radius)
+    with _coverage_cache_lock:
+        _coverage_cache[key] = result
+        while len(_coverage_cache) > COVERAGE_CACHE_SIZE:
+            _coverage_cache.popitem(last=False)
+    return result
+
+def _greedy_start(pop_to_cands, pop_weights: np.ndarray, k: int):
+    """
+    Greedy max-k-coverage solution used as a MIP start.
+    Returns: (x_start, y_start) float arrays of length n_cand / n_pop with
+    exactly min(k, n_cand) candidates selected and y[i] = 1 where point i is
+    covered and worth covering (weight > 0).
+    """
+    n_pop, n_cand = pop_to_cands.shape
+    cand_to_pop = pop_to_cands.tocsc()
+    positive = np.maximum(pop_weights, 0.0)
+    chosen = np.zeros(n_cand, dtype=bool)
+    if NUMBA_AVAILABLE:
+        # compiled lazy greedy over the candidate-major view (CSC columns = CSR rows of M.T)
+        word_ptr, words, masks = csr_row_words(cand_to_pop.indptr, cand_to_pop.indices)
+        picks, covered_bits = _lazy_greedy(cand_to_pop.indptr, cand_to_pop.indices,
+                                           word_ptr, words, masks, positive, n_cand, int(k))
+        chosen[picks] = True
+        covered = unpack(covered_bits, n_pop)
+    else:
+        covered = np.zeros(n_pop, dtype=bool)
+        for _ in range(min(int(k), n_cand)):
+            gains = pop_to_cands.T @ np.where(covered, 0.0, positive)
+            gains[chosen] = -np.inf
+            j = int(np.argmax(gains))
+            if not gains[j] > 0.0:
+                break
+            chosen[j] = True
+            covered[cand_to_pop.indices[cand_to_pop.indptr[j]:cand_to_pop.indptr[j + 1]]] = True
+    # the model selects exactly k: pad with unused candidates once nothing gains
+    missing = min(int(k), n_cand) - int(chosen.sum())
+    if missing > 0:
+        chosen[np.flatnonzero(~chosen)[:missing]] = True
+    return chosen.astype(float), (covered & (pop_weights > 0)).astype(float)
+
+def _lazy_cover_callback(x, y, pop_to_cands):
+    """
+    Gurobi callback adding y[i] <= sum(x[j] covering i) for every point an
+    incumbent marks covered while none of its candidates is selected.
+    x, y: the model's MVars
+    """
+    indptr, indices = pop_to_cands.indptr, pop_to_cands.indices
+
+    def callback(model, where):
+        if where != GRB.Callback.MIPSOL:
+            return
+        xv = np.asarray(model.cbGetSolution(x))
+        yv = np.asarray(model.cbGetSolution(y))
+        for i in np.flatnonzero((yv > 0.5) & (pop_to_cands @ xv < 0.5)):
+            # one MLinExpr over the covering slice of x
+            model.cbLazy(y[i] <= x[indices[indptr[i]:indptr[i + 1]]].sum())
+
+    return callback
+
 def solve_max_k_coverage_with_gurobi(candidates_df: pd.DataFrame, population_df: pd.DataFrame,
-                                     k: int, radius: float, time_limit: float = None, mip_gap: float = 1e-6, threads: int = 0):
+                                     k: int, radius: float, time_limit: float = None, mip_gap: float = 1e-6, threads: int = 0,
+                                     lazy_cover: bool = False, mip_focus: int = None, cuts: int = None,
+                                     heuristics: float = None, presolve: int = None, rins: int = None,
+                                     method: int = None, model=None):
     """
     Solve max-k-coverage using Gurobi MIP.
     Returns: selected_ids (list), total_covered (float), model (gurobi model or None)
     Raises ImportError if gurobipy is not available.
+    model: a model returned by an earlier call; when it was built for the same
+    points, radius, weights and lazy_cover, only its select_k right-hand side
+    is changed and it is solved again instead of being rebuilt (k sweeps).
+    Otherwise it is left alone and a new model is built.
+    lazy_cover: add the y <= M @ x coverage rows only when an incumbent violates
+    them (callback) instead of up front
+    mip_focus, cuts, heuristics, presolve, rins, method: Gurobi's MIPFocus, Cuts,
+    Heuristics, Presolve, RINS and Method parameters; None keeps Gurobi's default.
+    For set-cover-like instances MIPFocus=1 together with the greedy warm start
+    is the usual first thing to try; Method=2 (barrier) can speed up the root
+    LP when the population is large.
     """
     if gp is None:
         raise ImportError("gurobipy not available in this environment.")
 
-    candidates = candidates_df.reset_index(drop=True).copy()
-    population = population_df.reset_index(drop=True).copy()
-
+    # read the frames once into arrays; they are never copied or modified.
+    # Coordinates stay float64 (see _frames.coordinates)
     for col in ('x','y'):
-        if col not in candidates.columns or col not in population.columns:
+        if col not in candidates_df.columns or col not in population_df.columns:
             raise ValueError(f"Both candidates and population must contain column '{col}'")
-        candidates[col] = pd.to_numeric(candidates[col], errors='coerce')
-        population[col] = pd.to_numeric(population[col], errors='coerce')
-    if 'pop' not in population.columns:
-        population['pop'] = 1.0
-    population['pop'] = pd.to_numeric(population['pop'], errors='coerce').fillna(0.0)
+    cand_xy = coordinates(candidates_df)
+    pop_xy = coordinates(population_df)
+    pop_weights = population_weights(population_df)
 
-    n_cand = len(candidates); n_pop = len(population)
+    n_cand = len(cand_xy); n_pop = len(pop_xy)
     if n_cand == 0 or n_pop == 0 or k <= 0:
         return [], 0.0, None
 
-    coverage_lists, pop_to_cands = build_coverage_lists(candidates, population, radius)
+    coverage_lists, pop_to_cands = cached_coverage_lists(cand_xy, pop_xy, radius)
 
-    m = gp.Model("max_k_coverage")
-    # reduce console output
-    m.Params.OutputFlag = 0
+    # only points worth covering (covered by someone, positive weight) and only
+    # candidates reaching one of them matter: every other y stays 0 in an
+    # optimum and every other x only fills up the count of k
+    keep_p = (np.diff(pop_to_cands.indptr) > 0) & (pop_weights > 0)
+    model_cover = pop_to_cands[keep_p]
+    keep_c = np.bincount(model_cover.indices, minlength=n_cand) > 0
+    model_cover = model_cover[:, keep_c]
+    model_weights = pop_weights[keep_p]
+    useful = np.flatnonzero(keep_c)
 
-    if time_limit is not None:
-        m.setParam('TimeLimit', float(time_limit))
-    if mip_gap is not None:
-        m.setParam('MIPGap', float(mip_gap))
-    if threads and threads > 0:
-        m.setParam('Threads', int(threads))
+    m = None
+    if k <= n_cand and len(useful) <= k:
+        # every useful candidate fits in the budget: that is optimal, no MIP needed
+        selected = np.zeros(n_cand, dtype=bool)
+        selected[useful] = True
+        selected[np.flatnonzero(~keep_c)[:k - len(useful)]] = True
+        selected_indices = np.flatnonzero(selected).tolist()
+        total_covered = float(model_weights.sum())
+    else:
+        reuse = (model is not None and getattr(model, '_pop_to_cands', None) is pop_to_cands
+                 and model._lazy_cover == lazy_cover and np.array_equal(model._pop_weights, pop_weights))
+        if reuse:
+            # same instance as the model was built for: only the budget changes
+            m = model
+            m.resetParams()
+            x, y = m._x, m._y
+            m._select_k.RHS = int(k)
+        else:
+            m = gp.Model("max_k_coverage")
 
-    # decision vars
-    x = m.addVars(n_cand, vtype=GRB.BINARY, name="x")
-    y = m.addVars(n_pop, vtype=GRB.BINARY, name="y")
+            # decision vars
+            x = m.addMVar(len(useful), vtype=GRB.BINARY, name="x")
+            y = m.addMVar(len(model_weights), vtype=GRB.BINARY, name="y")
 
-    m.addConstr(x.sum() == int(k), name="select_k")
-    for i in range(n_pop):
-        covering = pop_to_cands[i]
-        if len(covering) == 0:
-            m.addConstr(y[i] == 0)
-        else:
-            m.addConstr(y[i] <= gp.quicksum(x[j] for j in covering), name=f"cover_{i}")
+            select_k = m.addConstr(x.sum() == int(k), name="select_k")
+            if not lazy_cover:
+                # y <= M @ x as one sparse matrix constraint
+                m.addConstr(y <= model_cover @ x, name="cover")
+
+            m.setObjective(model_weights @ y, GRB.MAXIMIZE)
 
-    pop_weights = population['pop'].values.astype(float)
-    m.setObjective(gp.quicksum(pop_weights[i] * y[i] for i in range(n_pop)), GRB.MAXIMIZE)
+            # what a later call needs to recognise the instance and reuse the model
+            m._pop_to_cands, m._pop_weights, m._lazy_cover = pop_to_cands, pop_weights, lazy_cover
+            m._x, m._y, m._select_k = x, y, select_k
 
-    start = time.time()
-    m.optimize()
-    solve_time = time.time() - start
+        # reduce console output
+        m.Params.OutputFlag = 0
 
-    # Extract solution
-    selected_indices = [j for j in range(n_cand) if x[j].X > 0.5]
+        if time_limit is not None:
+            m.setParam('TimeLimit', float(time_limit))
+        if mip_gap is not None:
+            m.setParam('MIPGap', float(mip_gap))
+        if threads and threads > 0:
+            m.setParam('Threads', int(threads))
+        # optional tuning knobs, passed straight to Gurobi when given
+        for name, value in (('MIPFocus', mip_focus), ('Cuts', cuts), ('Heuristics', heuristics),
+                            ('Presolve', presolve), ('RINS', rins), ('Method', method)):
+            if value is not None:
+                m.setParam(name, value)
+
+        callback = None
+        if lazy_cover:
+            m.Params.LazyConstraints = 1
+            callback = _lazy_cover_callback(x, y, model_cover)
+
+        # warm start from the greedy solution: a good incumbent from the first node on
+        x.Start, y.Start = _greedy_start(model_cover, model_weights, k)
+
+        start = time.time()
+        m.optimize(callback)
+        solve_time = time.time() - start
+
+        selected_indices = useful[x.X > 0.5].tolist()
+        total_covered = float(model_weights[y.X > 0.5].sum())
+
+    # Extract solution: ids of the selected rows in one fancy-index, as ints when they all convert
+    selected_ids = candidates_df['id'].to_numpy()[selected_indices]
     try:
-        selected_ids = [int(candidates.iloc[j]['id']) for j in selected_indices]
+        selected_ids = selected_ids.astype(int).tolist()
     except Exception:
-        selected_ids = [candidates.iloc[j]['id'] for j in selected_indices]
-
-    total_covered = float(sum(pop_weights[i] for i in range(n_pop) if y[i].X > 0.5))
+        selected_ids = selected_ids.tolist()
 
     return selected_ids, total_covered, m
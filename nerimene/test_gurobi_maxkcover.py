@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from nerimene.gurobi_maxkcover import gp, solve_max_k_coverage_with_gurobi
+
+
+@unittest.skipIf(gp is None, "gurobipy not available")
+class TestModelReuse(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        n_cand, n_pop = 40, 300
+        self.candidates = pd.DataFrame({'id': np.arange(n_cand) + 100,
+                                        'x': rng.random(n_cand) * 50, 'y': rng.random(n_cand) * 50})
+        self.population = pd.DataFrame({'x': rng.random(n_pop) * 50, 'y': rng.random(n_pop) * 50,
+                                        'pop': rng.integers(1, 20, n_pop)})
+        self.radius = 6.0
+
+    def solve(self, k, model=None):
+        return solve_max_k_coverage_with_gurobi(self.candidates, self.population, k, self.radius,
+                                                model=model)
+
+    def test_two_k_values_on_one_model(self):
+        _, _, model = self.solve(3)
+        self.assertIsNotNone(model)
+
+        ids, covered, reused = self.solve(6, model=model)
+        self.assertIs(reused, model)
+        self.assertEqual(model._select_k.RHS.item(), 6)
+        self.assertEqual(len(ids), 6)
+        self.assertEqual(len(set(ids)), 6)
+
+        _, fresh_covered, fresh_model = self.solve(6)
+        self.assertIsNot(fresh_model, model)
+        self.assertAlmostEqual(covered, fresh_covered)
+
+    def test_other_instance_builds_a_new_model(self):
+        _, _, model = self.solve(3)
+        self.population['pop'] = 1
+        _, _, other = self.solve(3, model=model)
+        self.assertIsNot(other, model)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ Usage:
 """
 
 import pickle
+import pickletools
 import os
 
 def create_brew_haven_project():
@@ -127,8 +128,11 @@ def save_project(filename='brew_haven_example.ssp'):
     project = create_brew_haven_project()
     
     try:
+        # Highest protocol, with unused PUT opcodes stripped, for a smaller
+        # and faster-loading file
+        data = pickletools.optimize(pickle.dumps(project, protocol=pickle.HIGHEST_PROTOCOL))
         with open(filename, 'wb') as f:
-            pickle.dump(project, f)
+            f.write(data)
         print(f"✓ Project saved: {filename}")
         print(f"  Employees: {len(project['employees'])}")
         print(f"  Store hours: {project['demand']['store_open_hour']} AM - {project['demand']['store_close_hour']} (24h)")
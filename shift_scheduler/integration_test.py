@@ -30,7 +30,7 @@ try:
         em.add_employee(**emp_data)
     print(f"✓ Loaded {len(em.employees)} employees")
     for i, emp in enumerate(em.employees, 1):
-        print(f"   {i}. {emp.name} (${emp.hourly_rate}/hr, {len(emp.availability)} hours available)")
+        print(f"   {i}. {emp.name} (${emp.hourly_rate}/hr, {bin(emp.availability).count('1')} hours available)")
 except Exception as e:
     print(f"✗ Error: {e}")
     sys.exit(1)
@@ -4,8 +4,9 @@ Manages hourly customer demand and required staffing levels
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import json
+import numpy as np
 
 
 @dataclass
@@ -24,8 +25,18 @@ class DemandProfile:
             for hour in range(self.store_open_hour, self.store_close_hour):
                 self.hourly_demand[hour] = 0
         
+        # Bumped on every demand mutation so views can cache derived data
+        self._cache_version = 0
+        self._snapshot = None
+        self._snapshot_key = None
+        
         self._validate()
     
+    @property
+    def cache_version(self) -> int:
+        """Counter incremented whenever hourly demand values change"""
+        return self._cache_version
+    
     def _validate(self):
         """Validate demand profile parameters"""
         if self.store_open_hour < 0 or self.store_open_hour >= 24:
@@ -44,6 +55,7 @@ class DemandProfile:
         if customer_count < 0:
             raise ValueError("Customer count cannot be negative")
         self.hourly_demand[hour] = customer_count
+        self._cache_version += 1
     
     def get_demand(self, hour: int) -> int:
         """Get customer demand for a specific hour"""
@@ -62,6 +74,18 @@ class DemandProfile:
             for hour in range(self.store_open_hour, self.store_close_hour)
         }
     
+    def get_all_required_staff_array(self, hours: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Get required staff as an array, in the order of `hours` (default: all operating hours)"""
+        if hours is None:
+            hours = range(self.store_open_hour, self.store_close_hour)
+        demands = np.fromiter(
+            (self.get_demand(hour) for hour in hours),
+            dtype=np.int64,
+            count=len(hours)
+        )
+        calculated_staff = (demands * self.staff_per_customer_ratio).astype(np.int64)
+        return np.maximum(calculated_staff, self.min_staff_per_hour)
+    
     def get_peak_hours(self, top_n: int = 3) -> List[Tuple[int, int]]:
         """Get the top N hours with highest demand"""
         sorted_hours = sorted(
@@ -89,6 +113,37 @@ class DemandProfile:
             return 0.0
         return self.get_total_daily_customers() / len(self.hourly_demand)
     
+    def get_summary_stats(self, top_n: int = 3) -> Tuple[int, float, int, List[Tuple[int, int]]]:
+        """
+        Get summary statistics in a single pass over the demand values
+        
+        Returns:
+            (total customers, average hourly demand, total required staff hours,
+             top N peak hours as (hour, demand) like get_peak_hours)
+        """
+        hours = np.fromiter(self.hourly_demand.keys(), dtype=np.int64,
+                            count=len(self.hourly_demand))
+        demands = np.fromiter(self.hourly_demand.values(), dtype=np.int64,
+                              count=len(self.hourly_demand))
+        staff_hours = int(self.get_all_required_staff_array().sum())
+        
+        if demands.size == 0:
+            return 0, 0.0, staff_hours, []
+        
+        total = int(demands.sum())
+        avg = total / demands.size
+        
+        # Sort key: highest demand first, ties kept in insertion order
+        order_key = -demands * demands.size + np.arange(demands.size)
+        top_n = min(top_n, demands.size)
+        if top_n <= 0:
+            return total, avg, staff_hours, []
+        top = np.argpartition(order_key, top_n - 1)[:top_n]
+        top = top[np.argsort(order_key[top])]
+        peaks = list(zip(hours[top].tolist(), demands[top].tolist()))
+        
+        return total, avg, staff_hours, peaks
+    
     def get_operating_hours(self) -> int:
         """Get total number of operating hours"""
         return self.store_close_hour - self.store_open_hour
@@ -106,6 +161,7 @@ class DemandProfile:
         
         if pattern_name.lower() in patterns:
             patterns[pattern_name.lower()]()
+            self._cache_version += 1
         else:
             raise ValueError(f"Unknown pattern: {pattern_name}")
     
@@ -160,6 +216,7 @@ class DemandProfile:
         """Scale all demand values by a factor"""
         for hour in self.hourly_demand:
             self.hourly_demand[hour] = int(self.hourly_demand[hour] * factor)
+        self._cache_version += 1
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
@@ -171,9 +228,27 @@ class DemandProfile:
             'min_staff_per_hour': self.min_staff_per_hour
         }
     
+    def to_dict_cached(self) -> dict:
+        """to_dict snapshot, reused until the demand or settings change"""
+        # Settings are plain attributes assigned by the views, so they are
+        # part of the key; demand changes go through the version counter
+        key = (self._cache_version, self.store_open_hour, self.store_close_hour,
+               self.staff_per_customer_ratio, self.min_staff_per_hour)
+        if key != self._snapshot_key:
+            snapshot = self.to_dict()
+            snapshot['hourly_demand'] = dict(self.hourly_demand)
+            self._snapshot = snapshot
+            self._snapshot_key = key
+        return self._snapshot
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'DemandProfile':
         """Create from dictionary"""
+        data = dict(data)
+        # JSON turns the integer hour keys into strings
+        data['hourly_demand'] = {
+            int(hour): count for hour, count in data.get('hourly_demand', {}).items()
+        }
         return cls(**data)
     
     def to_json(self) -> str:
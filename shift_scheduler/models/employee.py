@@ -4,10 +4,18 @@ Data class for storing employee information
 """
 
 from dataclasses import dataclass, field
-from typing import List, Set
+from typing import FrozenSet, Iterable, List, Tuple
 from datetime import time
 
 
+def hours_to_mask(hours: Iterable[int]) -> int:
+    """Convert an iterable of hours (0-23) to an availability bitmask"""
+    mask = 0
+    for hour in hours:
+        mask |= 1 << hour
+    return mask
+
+
 @dataclass
 class Employee:
     """Represents a retail store employee"""
@@ -17,12 +25,17 @@ class Employee:
     hourly_rate: float
     max_hours_per_day: int = 8
     max_hours_per_week: int = 40
-    availability: Set[int] = field(default_factory=set)  # Set of available hours (0-23)
-    skills: List[str] = field(default_factory=list)
+    availability: int = 0  # Bitmask of available hours: bit h set = available at hour h (0-23)
+    skills: Tuple[str, ...] = ()
     preferred_shifts: List[str] = field(default_factory=list)  # 'morning', 'afternoon', 'evening'
     
     def __post_init__(self):
         """Validate employee data after initialization"""
+        # Accept a collection of hours for backward compatibility
+        if not isinstance(self.availability, int):
+            self.availability = hours_to_mask(self.availability)
+        if not isinstance(self.skills, tuple):
+            self.skills = tuple(self.skills)
         if self.hourly_rate <= 0:
             raise ValueError("Hourly rate must be positive")
         if self.max_hours_per_day <= 0 or self.max_hours_per_day > 24:
@@ -30,22 +43,37 @@ class Employee:
         if not self.name.strip():
             raise ValueError("Employee name cannot be empty")
             
+    @property
+    def availability_hours(self) -> List[int]:
+        """Available hours as a sorted list"""
+        mask = self.availability
+        return [h for h in range(24) if mask >> h & 1]
+    
     def is_available(self, hour: int) -> bool:
         """Check if employee is available at a specific hour"""
-        return hour in self.availability
+        return bool(self.availability >> hour & 1)
     
     def add_availability(self, start_hour: int, end_hour: int):
         """Add availability for a time range"""
-        for hour in range(start_hour, end_hour):
-            self.availability.add(hour)
+        if end_hour > start_hour:
+            self.availability |= (1 << end_hour) - (1 << start_hour)
     
     def remove_availability(self, hour: int):
         """Remove availability for a specific hour"""
-        self.availability.discard(hour)
+        self.availability &= ~(1 << hour)
+    
+    @property
+    def skill_set(self) -> FrozenSet[str]:
+        """Lower-cased skills, rebuilt only when `skills` is reassigned"""
+        cached = self.__dict__.get('_skill_set')
+        if cached is None or cached[0] is not self.skills:
+            cached = (self.skills, frozenset(s.lower() for s in self.skills))
+            self.__dict__['_skill_set'] = cached
+        return cached[1]
     
     def has_skill(self, skill: str) -> bool:
         """Check if employee has a specific skill"""
-        return skill.lower() in [s.lower() for s in self.skills]
+        return skill.lower() in self.skill_set
     
     def get_daily_cost(self, hours: float) -> float:
         """Calculate cost for working specified hours"""
@@ -59,15 +87,15 @@ class Employee:
             'hourly_rate': self.hourly_rate,
             'max_hours_per_day': self.max_hours_per_day,
             'max_hours_per_week': self.max_hours_per_week,
-            'availability': list(self.availability),
-            'skills': self.skills,
+            'availability': self.availability_hours,
+            'skills': list(self.skills),
             'preferred_shifts': self.preferred_shifts
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Employee':
         """Create employee from dictionary"""
-        data['availability'] = set(data.get('availability', []))
+        data['availability'] = hours_to_mask(data.get('availability', []))
         return cls(**data)
     
     def __str__(self) -> str:
@@ -83,6 +111,10 @@ class EmployeeManager:
     def __init__(self):
         self.employees: List[Employee] = []
         self._next_id = 1
+        
+        # Serialized employees from to_dict_cached, rebuilt when dirty
+        self._dirty = True
+        self._snapshot: List[dict] = []
     
     def add_employee(self, name: str, hourly_rate: float, **kwargs) -> Employee:
         """Add a new employee"""
@@ -94,13 +126,33 @@ class EmployeeManager:
         )
         self.employees.append(employee)
         self._next_id += 1
+        self._dirty = True
         return employee
     
+    def add_many(self, records: Iterable[dict]) -> List[Employee]:
+        """Add employees from keyword dicts (e.g. Employee.to_dict output)
+        
+        Saved 'id' values are ignored; ids are assigned in order like
+        add_employee. Nothing is added if any record is invalid.
+        """
+        next_id = self._next_id
+        added = []
+        for record in records:
+            kwargs = {key: value for key, value in record.items() if key != 'id'}
+            added.append(Employee(id=next_id, **kwargs))
+            next_id += 1
+        
+        self.employees.extend(added)
+        self._next_id = next_id
+        self._dirty = True
+        return added
+    
     def remove_employee(self, employee_id: int) -> bool:
         """Remove an employee by ID"""
         for i, emp in enumerate(self.employees):
             if emp.id == employee_id:
                 self.employees.pop(i)
+                self._dirty = True
                 return True
         return False
     
@@ -127,6 +179,18 @@ class EmployeeManager:
         """Remove all employees"""
         self.employees.clear()
         self._next_id = 1
+        self._dirty = True
+    
+    def mark_dirty(self):
+        """Flag that an employee was edited in place"""
+        self._dirty = True
+    
+    def to_dict_cached(self) -> List[dict]:
+        """Serialized employees, rebuilt only after a change"""
+        if self._dirty:
+            self._snapshot = [emp.to_dict() for emp in self.employees]
+            self._dirty = False
+        return self._snapshot
     
     def get_total_labor_capacity(self) -> int:
         """Get total available labor hours per day"""
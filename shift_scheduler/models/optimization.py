@@ -24,6 +24,15 @@ class ScheduleResult:
     gap: float = 0.0
 
 
+@dataclass(frozen=True)
+class BuildParams:
+    """Model-building options of ShiftScheduler.build_model"""
+    objective: str = 'minimize_cost'  # 'minimize_cost' or 'maximize_coverage'
+    min_shift_length: int = 4  # Minimum consecutive hours for a shift
+    max_shift_length: int = 8  # Maximum consecutive hours for a shift
+    allow_overtime: bool = False  # Allow employees to work beyond max_hours_per_day
+
+
 class ShiftScheduler:
     """Optimizes employee shift scheduling using Gurobi"""
     
@@ -34,20 +43,18 @@ class ShiftScheduler:
         self.variables = {}
         self.result = None
         
-    def build_model(self, 
-                   objective: str = 'minimize_cost',
-                   min_shift_length: int = 4,
-                   max_shift_length: int = 8,
-                   allow_overtime: bool = False):
+    def build_model(self, params: BuildParams = BuildParams()):
         """
         Build the Gurobi optimization model
         
         Args:
-            objective: 'minimize_cost' or 'maximize_coverage'
-            min_shift_length: Minimum consecutive hours for a shift
-            max_shift_length: Maximum consecutive hours for a shift
-            allow_overtime: Allow employees to work beyond max_hours_per_day
+            params: Objective and shift-length options (see BuildParams)
         """
+        objective = params.objective
+        min_shift_length = params.min_shift_length
+        max_shift_length = params.max_shift_length
+        allow_overtime = params.allow_overtime
+        
         self.model = gp.Model("ShiftScheduling")
         self.model.setParam('OutputFlag', 0)  # Suppress Gurobi output
         
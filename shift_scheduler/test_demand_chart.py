@@ -0,0 +1,53 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QRegion
+from PyQt6.QtWidgets import QApplication
+
+try:
+    from models.demand import DemandProfile
+    from views.demand_tab import DemandBarChart
+except ImportError:  # models pulls in gurobipy
+    DemandBarChart = None
+
+
+@unittest.skipIf(DemandBarChart is None, "views not importable")
+class TestDemandBarChart(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.profile = DemandProfile(store_open_hour=8, store_close_hour=20)
+        self.profile.apply_pattern("bimodal")
+        self.chart = DemandBarChart(self.profile)
+        self.chart.resize(700, 300)
+        self.chart.show()
+        self.chart.grab()
+
+    def tearDown(self):
+        self.chart.close()
+
+    def full_render(self):
+        """The cached frame re-rendered from scratch, as an image"""
+        hours, demands = self.chart._chart_data()
+        bg_color = self.chart.palette().color(self.chart.backgroundRole())
+        self.chart._render_frame(QRegion(self.chart.rect()), hours, demands,
+                                 self.chart._max_demand, bg_color)
+        return self.chart._frame.toImage()
+
+    def test_partial_render_matches_full_render(self):
+        # one edit per hour, each re-rendering only that column
+        for hour in range(8, 20):
+            self.profile.set_demand(hour, (hour * 7) % 40)
+            self.chart.update_hour(hour)
+            self.chart.grab()
+            partial = self.chart._frame.toImage()
+            self.assertEqual(partial, self.full_render(), f"hour {hour}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,87 +7,105 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QSlider, QSpinBox, QDoubleSpinBox, QPushButton,
                              QGroupBox, QGridLayout, QComboBox, QMessageBox,
                              QScrollArea, QFrame)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QPainter, QColor, QPen
+from PyQt6.QtCore import Qt, QRect, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QPainter, QColor, QPen, QPixmap, QRegion
 from models.demand import DemandProfile
+from views.hour_labels import HOUR_COLON, HOUR_TICK
+import numpy as np
 
 
 class DemandBarChart(QWidget):
     """Custom widget to visualize demand as a bar chart"""
     
+    MARGIN = 40
+    
     def __init__(self, demand_profile: DemandProfile):
         super().__init__()
         self.demand_profile = demand_profile
         self.setMinimumHeight(200)
+        # Every pixel is painted in paintEvent, so Qt can skip erasing first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        
+        # Axes, Y-axis labels and title only change with size or scale
+        self._bg_pixmap = None
+        self._bg_key = None
+        
+        # Fully rendered chart and the demand values it shows; repaints with
+        # unchanged data just blit it, changed bars are re-rendered in place
+        self._frame = None
+        self._frame_key = None
+        self._frame_demands = None
+        
+        # Sorted hours, demand array and max demand, rebuilt only when the
+        # profile's cache version changes
+        self._data_key = None
+        self._sorted_hours = []
+        self._demands_np = None
+        self._max_demand = 1
+        
+        # Column rect of each bar in the current frame, for partial repaints
+        self._bar_rects = {}
+        
+        # Bar colors indexed by demand level: low, medium, high
+        self._colors = (QColor("#48bb78"), QColor("#ed8936"), QColor("#f56565"))
         
     def set_demand_profile(self, demand_profile: DemandProfile):
         """Update demand profile and redraw"""
         self.demand_profile = demand_profile
+        if not self.isVisible() or self._frame_is_current():
+            return
         self.update()
     
-    def paintEvent(self, event):
-        """Draw the bar chart"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        if not self.demand_profile or not self.demand_profile.hourly_demand:
+    def update_hour(self, hour: int):
+        """Schedule a repaint of a single bar, or of the whole chart if the scale changed"""
+        if not self.isVisible():
             return
-        
-        # Get dimensions
-        width = self.width()
-        height = self.height()
-        margin = 40
-        chart_width = width - 2 * margin
+        self._chart_data()
+        max_demand = self._max_demand
+        if self._bg_key is None or max_demand != self._bg_key[3] or hour not in self._bar_rects:
+            self.update()
+        else:
+            self.update(self._bar_rects[hour])
+    
+    def _chart_data(self):
+        """Get the hours (sorted) and their demand values as an array"""
+        key = (id(self.demand_profile), self.demand_profile.cache_version)
+        if key != self._data_key:
+            hourly_demand = self.demand_profile.hourly_demand
+            self._sorted_hours = sorted(hourly_demand.keys())
+            self._demands_np = np.array([hourly_demand[h] for h in self._sorted_hours],
+                                        dtype=np.int64)
+            self._max_demand = int(self._demands_np.max(initial=0)) or 1
+            self._data_key = key
+        return self._sorted_hours, self._demands_np
+    
+    def _frame_is_current(self) -> bool:
+        """Check whether the cached frame already shows the current demand"""
+        if self._frame_demands is None or not self.demand_profile:
+            return False
+        hours, demands = self._chart_data()
+        return (tuple(hours) == self._frame_key[4]
+                and np.array_equal(demands, self._frame_demands))
+    
+    def _render_background(self, width: int, height: int, max_demand: int) -> QPixmap:
+        """Render the static part of the chart (axes, Y-axis labels, title)"""
+        margin = self.MARGIN
         chart_height = height - 2 * margin
         
-        # Get data
-        hours = sorted(self.demand_profile.hourly_demand.keys())
-        demands = [self.demand_profile.hourly_demand[h] for h in hours]
-        max_demand = max(demands) if demands else 1
-        
-        if max_demand == 0:
-            max_demand = 1
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * dpr), int(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
         
-        bar_width = chart_width / len(hours) * 0.8
-        spacing = chart_width / len(hours)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())
         
         # Draw axes
         painter.setPen(QPen(QColor("#cbd5e0"), 2))
         painter.drawLine(margin, height - margin, width - margin, height - margin)  # X-axis
         painter.drawLine(margin, margin, margin, height - margin)  # Y-axis
         
-        # Draw bars
-        for i, (hour, demand) in enumerate(zip(hours, demands)):
-            bar_height = (demand / max_demand) * chart_height
-            x = margin + i * spacing + (spacing - bar_width) / 2
-            y = height - margin - bar_height
-            
-            # Color gradient based on demand level
-            if demand < max_demand * 0.3:
-                color = QColor("#48bb78")  # Green - low
-            elif demand < max_demand * 0.7:
-                color = QColor("#ed8936")  # Orange - medium
-            else:
-                color = QColor("#f56565")  # Red - high
-            
-            painter.fillRect(int(x), int(y), int(bar_width), int(bar_height), color)
-            
-            # Draw hour label
-            painter.setPen(QColor("#4a5568"))
-            font = painter.font()
-            font.setPointSize(8)
-            painter.setFont(font)
-            painter.drawText(int(x), height - margin + 15, int(bar_width), 20,
-                           Qt.AlignmentFlag.AlignCenter, f"{hour}h")
-            
-            # Draw demand value on top of bar if space allows
-            if bar_height > 20:
-                painter.setPen(QColor("white"))
-                font.setBold(True)
-                painter.setFont(font)
-                painter.drawText(int(x), int(y) + 5, int(bar_width), 20,
-                               Qt.AlignmentFlag.AlignCenter, str(demand))
-        
         # Draw Y-axis labels
         painter.setPen(QColor("#4a5568"))
         font = painter.font()
@@ -109,6 +127,137 @@ class DemandBarChart(QWidget):
         painter.setFont(font)
         painter.drawText(0, 5, width, 30, Qt.AlignmentFlag.AlignCenter,
                         "Profil de Demande Horaire")
+        
+        painter.end()
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Draw the bar chart"""
+        painter = QPainter(self)
+        bg_color = self.palette().color(self.backgroundRole())
+        
+        if not self.demand_profile or not self.demand_profile.hourly_demand:
+            painter.fillRect(event.rect(), bg_color)
+            return
+        
+        # Get dimensions
+        width = self.width()
+        height = self.height()
+        margin = self.MARGIN
+        chart_width = width - 2 * margin
+        
+        # Get data
+        hours, demands = self._chart_data()
+        max_demand = self._max_demand
+        spacing = chart_width / len(hours)
+        
+        dpr = self.devicePixelRatioF()
+        frame_key = (width, height, dpr, max_demand, tuple(hours), bg_color.rgba())
+        if self._frame is None or frame_key != self._frame_key:
+            # Layout changed: render everything into a fresh frame
+            self._frame = QPixmap(int(width * dpr), int(height * dpr))
+            self._frame.setDevicePixelRatio(dpr)
+            self._frame_key = frame_key
+            self._bar_rects = {
+                hour: QRect(int(margin + i * spacing), 0, int(spacing) + 2, height)
+                for i, hour in enumerate(hours)
+            }
+            render_region = QRegion(self.rect())
+        else:
+            # Same layout: only re-render the columns whose value changed
+            render_region = QRegion()
+            for i in np.flatnonzero(demands != self._frame_demands).tolist():
+                render_region = render_region.united(self._bar_rects[hours[i]])
+        
+        if not render_region.isEmpty():
+            self._render_frame(render_region, hours, demands, max_demand, bg_color)
+            self._frame_demands = demands
+        
+        painter.drawPixmap(0, 0, self._frame)
+    
+    def _render_frame(self, region: QRegion, hours, demand_arr, max_demand: int,
+                      bg_color: QColor):
+        """Render the part of the cached frame inside region"""
+        width = self.width()
+        height = self.height()
+        margin = self.MARGIN
+        chart_width = width - 2 * margin
+        chart_height = height - 2 * margin
+        
+        bar_width = chart_width / len(hours) * 0.8
+        spacing = chart_width / len(hours)
+        demands = demand_arr.tolist()
+        
+        # Re-render the static background only when size, pixel ratio or scale changed
+        key = (width, height, self.devicePixelRatioF(), max_demand)
+        if key != self._bg_key:
+            self._bg_pixmap = self._render_background(width, height, max_demand)
+            self._bg_key = key
+        
+        painter = QPainter(self._frame)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())
+        painter.setClipRegion(region)
+        painter.fillRect(region.boundingRect(), bg_color)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        
+        # Color index per bar: 0 = low (< 30%), 1 = medium (< 70%), 2 = high
+        color_idx = ((demand_arr >= max_demand * 0.3).astype(np.int8)
+                     + (demand_arr >= max_demand * 0.7).astype(np.int8)).tolist()
+        
+        # Bar geometry for all hours at once
+        positions = np.arange(len(hours))
+        xs = (margin + positions * spacing + (spacing - bar_width) / 2).tolist()
+        bar_heights = (demand_arr / max_demand * chart_height).tolist()
+        
+        # Bucket bars inside the region by color
+        visible = []
+        bar_buckets = ([], [], [])
+        for i, hour in enumerate(hours):
+            if not region.intersects(self._bar_rects[hour]):
+                continue
+            visible.append(i)
+            y = height - margin - bar_heights[i]
+            bar_buckets[color_idx[i]].append(
+                QRect(int(xs[i]), int(y), int(bar_width), int(bar_heights[i]))
+            )
+        
+        # Draw bars: one batched call per color
+        painter.setPen(Qt.PenStyle.NoPen)
+        for color, rects in zip(self._colors, bar_buckets):
+            if rects:
+                painter.setBrush(color)
+                painter.drawRects(rects)
+        
+        # Label fonts are fixed per kind, so a column looks the same whichever
+        # other columns are re-rendered with it
+        label_font = QFont(self.font())
+        label_font.setPointSize(8)
+        label_font.setBold(False)
+        value_font = QFont(label_font)
+        value_font.setBold(True)
+        
+        # Draw labels
+        for i in visible:
+            hour, demand = hours[i], demands[i]
+            x = xs[i]
+            bar_height = bar_heights[i]
+            y = height - margin - bar_height
+            
+            # Draw hour label
+            painter.setPen(QColor("#4a5568"))
+            painter.setFont(label_font)
+            painter.drawText(int(x), height - margin + 15, int(bar_width), 20,
+                           Qt.AlignmentFlag.AlignCenter, HOUR_TICK[hour])
+            
+            # Draw demand value on top of bar if space allows
+            if bar_height > 20:
+                painter.setPen(QColor("white"))
+                painter.setFont(value_font)
+                painter.drawText(int(x), int(y) + 5, int(bar_width), 20,
+                               Qt.AlignmentFlag.AlignCenter, str(demand))
+        
+        painter.end()
 
 
 class DemandTab(QWidget):
@@ -116,11 +265,24 @@ class DemandTab(QWidget):
     
     demand_changed = pyqtSignal()
     
+    # The 24 hourly sliders overflow small screens
+    needs_scroll = True
+    
     def __init__(self, demand_profile: DemandProfile):
         super().__init__()
         self.demand_profile = demand_profile
         self.hour_sliders = {}
         self.hour_spinboxes = {}
+        self.req_labels = {}
+        self._summary_text = None
+        
+        # Coalesce bursts of slider/spinbox ticks into one chart/summary refresh
+        self._pending_hours = set()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(30)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
         self.init_ui()
         self.load_demand_data()
     
@@ -243,7 +405,7 @@ class DemandTab(QWidget):
         
         for i, hour in enumerate(hours):
             # Hour label
-            hour_label = QLabel(f"{hour}:00")
+            hour_label = QLabel(HOUR_COLON[hour])
             hour_label.setMinimumWidth(50)
             sliders_layout.addWidget(hour_label, i, 0)
             
@@ -251,9 +413,8 @@ class DemandTab(QWidget):
             slider = QSlider(Qt.Orientation.Horizontal)
             slider.setRange(0, 200)
             slider.setValue(0)
-            slider.valueChanged.connect(
-                lambda val, h=hour: self.update_demand_from_slider(h, val)
-            )
+            slider.setProperty("hour", hour)
+            slider.valueChanged.connect(self._on_slider_changed)
             self.hour_sliders[hour] = slider
             sliders_layout.addWidget(slider, i, 1)
             
@@ -261,9 +422,8 @@ class DemandTab(QWidget):
             spinbox = QSpinBox()
             spinbox.setRange(0, 500)
             spinbox.setValue(0)
-            spinbox.valueChanged.connect(
-                lambda val, h=hour: self.update_demand_from_spinbox(h, val)
-            )
+            spinbox.setProperty("hour", hour)
+            spinbox.valueChanged.connect(self._on_spinbox_changed)
             self.hour_spinboxes[hour] = spinbox
             sliders_layout.addWidget(spinbox, i, 2)
             
@@ -271,8 +431,8 @@ class DemandTab(QWidget):
             req_label = QLabel("→ 0 employés")
             req_label.setMinimumWidth(120)
             req_label.setStyleSheet("color: #667eea; font-weight: bold;")
-            req_label.setObjectName(f"req_label_{hour}")
             sliders_layout.addWidget(req_label, i, 3)
+            self.req_labels[hour] = req_label
         
         scroll.setWidget(scroll_widget)
         
@@ -294,11 +454,28 @@ class DemandTab(QWidget):
     
     def load_demand_data(self):
         """Load demand data into UI controls"""
+        # Block per-widget signals so the chart/summary refresh once, not per hour
         for hour in self.hour_sliders:
             demand = self.demand_profile.get_demand(hour)
+            self.hour_sliders[hour].blockSignals(True)
+            self.hour_spinboxes[hour].blockSignals(True)
             self.hour_sliders[hour].setValue(demand)
             self.hour_spinboxes[hour].setValue(demand)
-            self.update_required_label(hour)
+            self.hour_sliders[hour].blockSignals(False)
+            self.hour_spinboxes[hour].blockSignals(False)
+        
+        self.update_all_required_labels()
+        self.update_chart()
+        self.update_summary()
+        self.demand_changed.emit()
+    
+    def _on_slider_changed(self, value: int):
+        """Dispatch a slider change to the hour stored on the sender"""
+        self.update_demand_from_slider(self.sender().property("hour"), value)
+    
+    def _on_spinbox_changed(self, value: int):
+        """Dispatch a spinbox change to the hour stored on the sender"""
+        self.update_demand_from_spinbox(self.sender().property("hour"), value)
     
     def update_demand_from_slider(self, hour: int, value: int):
         """Update demand when slider changes"""
@@ -308,9 +485,8 @@ class DemandTab(QWidget):
         
         self.demand_profile.set_demand(hour, value)
         self.update_required_label(hour)
-        self.update_chart()
-        self.update_summary()
-        self.demand_changed.emit()
+        self._pending_hours.add(hour)
+        self._refresh_timer.start()
     
     def update_demand_from_spinbox(self, hour: int, value: int):
         """Update demand when spinbox changes"""
@@ -320,16 +496,35 @@ class DemandTab(QWidget):
         
         self.demand_profile.set_demand(hour, value)
         self.update_required_label(hour)
-        self.update_chart()
+        self._pending_hours.add(hour)
+        self._refresh_timer.start()
+    
+    def _do_refresh(self):
+        """Refresh chart and summary once after a burst of demand edits"""
+        for hour in self._pending_hours:
+            self.chart.update_hour(hour)
+        self._pending_hours.clear()
         self.update_summary()
         self.demand_changed.emit()
     
     def update_required_label(self, hour: int):
         """Update required staff label for an hour"""
         required = self.demand_profile.calculate_required_staff(hour)
-        label = self.findChild(QLabel, f"req_label_{hour}")
-        if label:
-            label.setText(f"→ {required} employé{'s' if required > 1 else ''}")
+        self.req_labels[hour].setText(self._required_text(required))
+    
+    def update_all_required_labels(self):
+        """Update every required staff label from a single batch computation"""
+        # the labels keep the hours they were built for, which can differ from
+        # the profile's current store hours (e.g. after loading a project)
+        hours = list(self.req_labels)
+        required_staff = self.demand_profile.get_all_required_staff_array(hours)
+        for label, required in zip(self.req_labels.values(), required_staff.tolist()):
+            label.setText(self._required_text(required))
+    
+    @staticmethod
+    def _required_text(required: int) -> str:
+        """Format the required staff label text"""
+        return f"→ {required} employé{'s' if required > 1 else ''}"
     
     def update_store_hours(self):
         """Update store operating hours"""
@@ -356,16 +551,14 @@ class DemandTab(QWidget):
     def update_ratio(self):
         """Update staff per customer ratio"""
         self.demand_profile.staff_per_customer_ratio = self.ratio_spin.value()
-        for hour in self.hour_sliders:
-            self.update_required_label(hour)
+        self.update_all_required_labels()
         self.update_summary()
         self.demand_changed.emit()
     
     def update_min_staff(self):
         """Update minimum staff requirement"""
         self.demand_profile.min_staff_per_hour = self.min_staff_spin.value()
-        for hour in self.hour_sliders:
-            self.update_required_label(hour)
+        self.update_all_required_labels()
         self.update_summary()
         self.demand_changed.emit()
     
@@ -386,26 +579,17 @@ class DemandTab(QWidget):
         if pattern_name in pattern_map:
             self.demand_profile.apply_pattern(pattern_map[pattern_name])
             self.load_demand_data()
-            self.update_chart()
-            self.update_summary()
-            self.demand_changed.emit()
     
     def scale_demand(self, factor: float):
         """Scale all demand values"""
         self.demand_profile.scale_demand(factor)
         self.load_demand_data()
-        self.update_chart()
-        self.update_summary()
-        self.demand_changed.emit()
     
     def reset_demand(self):
         """Reset all demand to zero"""
         for hour in self.hour_sliders:
             self.demand_profile.set_demand(hour, 0)
         self.load_demand_data()
-        self.update_chart()
-        self.update_summary()
-        self.demand_changed.emit()
     
     def update_chart(self):
         """Refresh the demand chart"""
@@ -413,17 +597,17 @@ class DemandTab(QWidget):
     
     def update_summary(self):
         """Update summary statistics"""
-        total_customers = self.demand_profile.get_total_daily_customers()
-        avg_demand = self.demand_profile.get_average_hourly_demand()
-        required_staff = self.demand_profile.get_all_required_staff()
-        total_staff_hours = sum(required_staff.values())
-        
-        peak_hours = self.demand_profile.get_peak_hours(3)
+        (total_customers, avg_demand,
+         total_staff_hours, peak_hours) = self.demand_profile.get_summary_stats(3)
         peak_text = ", ".join([f"{h}h ({d} clients)" for h, d in peak_hours])
         
-        self.summary_label.setText(
+        summary_text = (
             f"📊 Total clients: {total_customers} | "
             f"Moyenne: {avg_demand:.1f}/h | "
             f"Heures personnel requises: {total_staff_hours}h | "
             f"Pics: {peak_text}"
-        )
\ No newline at end of file
+        )
+        # Only touch the label when the text actually changed
+        if summary_text != self._summary_text:
+            self._summary_text = summary_text
+            self.summary_label.setText(summary_text)
\ No newline at end of file
@@ -10,6 +10,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 from models.employee import Employee, EmployeeManager
+from views.hour_labels import HOUR_COLON
 
 
 class EmployeeDialog(QDialog):
@@ -75,12 +76,16 @@ class EmployeeDialog(QDialog):
         hours_layout = QGridLayout()
         
         for i, hour in enumerate(range(6, 23)):
-            checkbox = QCheckBox(f"{hour}:00")
+            checkbox = QCheckBox(HOUR_COLON[hour])
             self.availability_checks[hour] = checkbox
             hours_layout.addWidget(checkbox, i // 6, i % 6)
         
         avail_layout.addLayout(hours_layout)
         
+        # Parallel key/checkbox lists so form reads are a single tight loop
+        self._avail_hours = list(self.availability_checks)
+        self._avail_boxes = [self.availability_checks[h] for h in self._avail_hours]
+        
         # Quick select buttons
         quick_btns = QHBoxLayout()
         select_all_btn = QPushButton("Tout sélectionner")
@@ -105,6 +110,9 @@ class EmployeeDialog(QDialog):
             self.skill_checks[skill] = checkbox
             skills_layout.addWidget(checkbox, i // 3, i % 3)
         
+        self._skill_names = list(self.skill_checks)
+        self._skill_boxes = [self.skill_checks[s] for s in self._skill_names]
+        
         skills_group.setLayout(skills_layout)
         layout.addWidget(skills_group)
         
@@ -139,26 +147,26 @@ class EmployeeDialog(QDialog):
         self.max_hours_week.setValue(self.employee.max_hours_per_week)
         
         # Set availability checkboxes
-        for hour in self.employee.availability:
-            if hour in self.availability_checks:
-                self.availability_checks[hour].setChecked(True)
+        mask = self.employee.availability
+        for hour, checkbox in zip(self._avail_hours, self._avail_boxes):
+            checkbox.setChecked(bool(mask >> hour & 1))
         
         # Set skill checkboxes
-        for skill, checkbox in self.skill_checks.items():
-            if skill in self.employee.skills:
-                checkbox.setChecked(True)
+        skills = self.employee.skills
+        for skill, checkbox in zip(self._skill_names, self._skill_boxes):
+            checkbox.setChecked(skill in skills)
     
     def get_employee_data(self):
         """Get employee data from form"""
-        availability = set(
-            hour for hour, checkbox in self.availability_checks.items()
-            if checkbox.isChecked()
-        )
+        availability = 0
+        for hour, checkbox in zip(self._avail_hours, self._avail_boxes):
+            if checkbox.isChecked():
+                availability |= 1 << hour
         
-        skills = [
-            skill for skill, checkbox in self.skill_checks.items()
+        skills = tuple(
+            skill for skill, checkbox in zip(self._skill_names, self._skill_boxes)
             if checkbox.isChecked()
-        ]
+        )
         
         return {
             'name': self.name_edit.text().strip(),
@@ -175,6 +183,9 @@ class EmployeeTab(QWidget):
     
     employees_changed = pyqtSignal()
     
+    # The employee table scrolls by itself, so no outer scroll area
+    needs_scroll = False
+    
     def __init__(self, employee_manager: EmployeeManager):
         super().__init__()
         self.employee_manager = employee_manager
@@ -247,12 +258,15 @@ class EmployeeTab(QWidget):
     
     def refresh_table(self):
         """Refresh employee table"""
-        self.table.setRowCount(0)
+        employees = self.employee_manager.get_all_employees()
         
-        for emp in self.employee_manager.get_all_employees():
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
+        # Size the table once and fill cells by index, with repaints suspended
+        sorting_enabled = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
+        self.table.setRowCount(len(employees))
+        
+        for row, emp in enumerate(employees):
             # ID
             self.table.setItem(row, 0, QTableWidgetItem(str(emp.id)))
             
@@ -266,7 +280,7 @@ class EmployeeTab(QWidget):
             self.table.setItem(row, 3, QTableWidgetItem(f"{emp.max_hours_per_day}h"))
             
             # Availability
-            avail_count = len(emp.availability)
+            avail_count = bin(emp.availability).count("1")
             avail_text = f"{avail_count} heures"
             self.table.setItem(row, 4, QTableWidgetItem(avail_text))
             
@@ -274,6 +288,9 @@ class EmployeeTab(QWidget):
             skills_text = ", ".join(emp.skills) if emp.skills else "Aucune"
             self.table.setItem(row, 5, QTableWidgetItem(skills_text))
         
+        self.table.setUpdatesEnabled(True)
+        self.table.setSortingEnabled(sorting_enabled)
+        
         self.update_stats()
     
     def update_stats(self):
@@ -330,6 +347,7 @@ class EmployeeTab(QWidget):
                 employee.max_hours_per_week = data['max_hours_per_week']
                 employee.availability = data['availability']
                 employee.skills = data['skills']
+                self.employee_manager.mark_dirty()
                 
                 self.refresh_table()
                 self.employees_changed.emit()
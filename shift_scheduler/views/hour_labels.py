@@ -0,0 +1,11 @@
+"""
+Hour Labels
+Hour label strings shared by the tabs, built once instead of on every
+paint / pattern apply / dialog build
+"""
+
+# "8h": chart axis ticks
+HOUR_TICK = tuple(f"{h}h" for h in range(25))
+
+# "8:00": hour rows and availability checkboxes
+HOUR_COLON = tuple(f"{h}:00" for h in range(25))
@@ -5,10 +5,12 @@ Integrates all tabs and provides application structure
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QTabWidget, QLabel, QPushButton, QStatusBar,
-                             QMenuBar, QMenu, QMessageBox, QFileDialog, QApplication)
-from PyQt6.QtCore import Qt
+                             QMenuBar, QMenu, QMessageBox, QFileDialog, QApplication,
+                             QScrollArea)
+from PyQt6.QtCore import (Qt, QObject, QRunnable, QThreadPool, QTimer,
+                          pyqtSignal, pyqtSlot)
 from PyQt6.QtGui import QAction, QFont
-from models.employee import EmployeeManager
+from models.employee import EmployeeManager, hours_to_mask
 from models.demand import DemandProfile
 from views.employee_tab import EmployeeTab
 from views.demand_tab import DemandTab
@@ -18,7 +20,150 @@ import pickle
 import os
 
 
+# resources/ sits next to main.py, one level up from views/
+_RESOURCES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resources'
+)
+
+# Sample fixtures, built once: (name, hourly rate, max hours per day,
+# availability bitmask, skills tuple)
+_AVAIL_8_17 = hours_to_mask(range(8, 17))
+_AVAIL_8_20 = hours_to_mask(range(8, 20))
+_AVAIL_9_18 = hours_to_mask(range(9, 18))
+_AVAIL_10_22 = hours_to_mask(range(10, 22))
+_AVAIL_11_23 = hours_to_mask(range(11, 23))
+_AVAIL_14_20 = hours_to_mask(range(14, 20))
+
+_SAMPLE_EMPLOYEES = {
+    "retail": (
+        ("Marie Dubois", 18.50, 8, _AVAIL_8_20, ("Caisse", "Service client")),
+        ("Jean Martin", 16.00, 6, _AVAIL_9_18, ("Stock",)),
+        ("Sophie Leroux", 22.00, 8, _AVAIL_8_20, ("Manager", "Caisse")),
+        ("Pierre Blanc", 15.50, 4, _AVAIL_14_20, ("Stock", "Merchandising")),
+        ("Emma Petit", 17.00, 8, _AVAIL_8_17, ("Service client", "Caisse")),
+    ),
+    "restaurant": (
+        ("Chef Antoine", 25.00, 10, _AVAIL_10_22, ("Cuisine",)),
+        ("Serveur Lucas", 14.00, 8, _AVAIL_11_23, ("Service",)),
+    ),
+}
+
+_USER_GUIDE_HTML = """
+<h2>Guide d'utilisation</h2>
+
+<h3>1. Employés</h3>
+<p>Ajoutez vos employés avec leurs taux horaires, disponibilités et compétences.</p>
+
+<h3>2. Demande</h3>
+<p>Configurez la demande horaire attendue (nombre de clients par heure).</p>
+
+<h3>3. Planification</h3>
+<p>Cliquez sur "Optimiser" pour générer le planning optimal avec Gurobi.</p>
+
+<h3>Conseils</h3>
+<ul>
+<li>Définissez au moins 3-4 employés pour de bons résultats</li>
+<li>Assurez-vous que les disponibilités couvrent les heures d'ouverture</li>
+<li>Utilisez les motifs prédéfinis pour la demande</li>
+</ul>
+
+"""
+
+_ABOUT_HTML = (
+    "<h3>Planificateur de Quarts v1.0</h3>"
+    "<p>Application d'optimisation des horaires de travail pour le commerce de détail</p>"
+    "<p><b>Technologies:</b></p>"
+    "<ul>"
+    "<li>PyQt6 - Interface graphique</li>"
+    "<li>Gurobi - Optimisation mathématique</li>"
+    "<li>Python 3.8+</li>"
+    "</ul>"
+    "<p><b>Fonctionnalités:</b></p>"
+    "<ul>"
+    "<li>Gestion des employés et disponibilités</li>"
+    "<li>Configuration de la demande horaire</li>"
+    "<li>Optimisation automatique avec contraintes</li>"
+    "<li>Visualisation Gantt des horaires</li>"
+    "</ul>"
+    "<p>aziz haddadi © 2025</p>"
+)
+
+
+# Menu bar layout: (menu title, entries). An entry is
+# (label, shortcut, handler method name), None for a separator, or a nested
+# (submenu title, entries) pair.
+_MENUS = (
+    ("&Fichier", (
+        ("Nouveau projet", "Ctrl+N", "new_project"),
+        ("Ouvrir...", "Ctrl+O", "open_project"),
+        ("Enregistrer", "Ctrl+S", "save_project"),
+        ("Enregistrer sous...", "Ctrl+Shift+S", "save_project_as"),
+        None,
+        ("Charger exemple", (
+            ("Magasin détail (standard)", None, "_load_retail"),
+            ("Restaurant", None, "_load_restaurant"),
+        )),
+        None,
+        ("Quitter", "Ctrl+Q", "close"),
+    )),
+    ("&Édition", (
+        ("Effacer toutes les données", None, "clear_all_data"),
+    )),
+    ("&Aide", (
+        ("Guide d'utilisation", None, "show_user_guide"),
+        ("À propos", None, "show_about"),
+    )),
+)
+
+
+def _read_project_file(filename: str) -> dict:
+    """Read a project file (JSON, or the older pickle format)"""
+    with open(filename, 'rb') as f:
+        raw = f.read()
+    
+    try:
+        return json.loads(raw.decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        # Projects saved before the JSON format were pickled
+        return pickle.loads(raw)
+
+
+def _write_project_file(filename: str, data: dict):
+    """Write a project file as JSON"""
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+class _FileTaskSignals(QObject):
+    """Signals of a _FileTask: (filename, result) or (filename, error)"""
+    finished = pyqtSignal(str, object)
+    failed = pyqtSignal(str, str)
+
+
+class _FileTask(QRunnable):
+    """Runs project file I/O on the global thread pool"""
+    
+    def __init__(self, signals: _FileTaskSignals, filename: str, func, *args):
+        super().__init__()
+        self.signals = signals
+        self.filename = filename
+        self.func = func
+        self.args = args
+    
+    def run(self):
+        try:
+            result = self.func(self.filename, *self.args)
+        except Exception as e:
+            self.signals.failed.emit(self.filename, str(e))
+        else:
+            self.signals.finished.emit(self.filename, result)
+
+
 class MainWindow(QMainWindow):
+    # Header fonts, created on first use (QFont needs a running QApplication)
+    _title_font_cache = None
+    _subtitle_font_cache = None
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Planificateur de Quarts - Retail Staff Scheduler")
@@ -33,8 +178,25 @@ class MainWindow(QMainWindow):
             min_staff_per_hour=1
         )
         
-        # Current theme
+        # Project file used by "Enregistrer"; None until opened or saved as
+        self.current_filename = None
+        
+        # Current theme; stylesheet text is cached by path after the first read
         self.is_dark_theme = False
+        self._qss_cache = {}
+        self._light_qss = self._get_resource_path('style.qss')
+        self._dark_qss = self._get_resource_path('style_dark.qss')
+        
+        # Project writes run one at a time, in order, so two quick saves to
+        # the same file never write it concurrently
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        
+        # Bursts of data-change signals collapse into one status message
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(150)
+        self._status_timer.timeout.connect(self._show_data_changed)
         
         self.init_ui()
         self.create_menu_bar()
@@ -42,11 +204,14 @@ class MainWindow(QMainWindow):
         
         # Load light theme on startup
         try:
-            qss_file = self._get_resource_path('style.qss')
-            self._load_stylesheet(qss_file)
+            self._load_stylesheet(self._light_qss)
         except Exception as e:
             print(f"Warning: Could not load theme: {e}")
         
+        # Read the dark theme once the event loop is idle so the first
+        # toggle does not hit the disk
+        QTimer.singleShot(0, self._preload_dark)
+        
         # Load sample data
         self.load_sample_data()
         
@@ -69,22 +234,78 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.tabs.setDocumentMode(True)
         
-        # Create tabs with actual implementations
-        self.employees_tab = EmployeeTab(self.employee_manager)
-        self.demand_tab = DemandTab(self.demand_profile)
-        self.schedule_tab = ScheduleTab(self.employee_manager, self.demand_profile)
+        # Tabs are built lazily the first time they are selected; until then
+        # each index holds an empty placeholder
+        self.employees_tab = None
+        self.demand_tab = None
+        self.schedule_tab = None
+        self._tab_factories = {
+            0: self._make_employees_tab,
+            1: self._make_demand_tab,
+            2: self._make_schedule_tab,
+        }
+        self.tabs.addTab(QWidget(), "👥 Employés")
+        self.tabs.addTab(QWidget(), "📊 Demande")
+        self.tabs.addTab(QWidget(), "🗓️ Planification")
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        
+        # The first visible tab is built right away
+        self._ensure_tab_built(0)
         
-        # Connect signals
+        main_layout.addWidget(self.tabs)
+    
+    def _make_employees_tab(self) -> QWidget:
+        """Build the employees tab"""
+        self.employees_tab = EmployeeTab(self.employee_manager)
         self.employees_tab.employees_changed.connect(self.on_data_changed)
+        return self.employees_tab
+    
+    def _make_demand_tab(self) -> QWidget:
+        """Build the demand tab"""
+        self.demand_tab = DemandTab(self.demand_profile)
         self.demand_tab.demand_changed.connect(self.on_data_changed)
-        
-        # Wrap tabs in scroll areas so content fits smaller screens
-        self.tabs.addTab(self._wrap_scroll(self.employees_tab), "👥 Employés")
-        self.tabs.addTab(self._wrap_scroll(self.demand_tab), "📊 Demande")
-        self.tabs.addTab(self._wrap_scroll(self.schedule_tab), "🗓️ Planification")
-        
-        main_layout.addWidget(self.tabs)
-        
+        return self.demand_tab
+    
+    def _make_schedule_tab(self) -> QWidget:
+        """Build the schedule tab"""
+        self.schedule_tab = ScheduleTab(self.employee_manager, self.demand_profile)
+        return self.schedule_tab
+    
+    @pyqtSlot(int)
+    def _ensure_tab_built(self, index: int):
+        """Replace the placeholder at index with the real tab on first use"""
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+        
+        real_tab = factory()
+        label = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+        
+        # Wrap tall tabs in scroll areas so content fits smaller screens
+        if real_tab.needs_scroll:
+            real_tab = self._wrap_scroll(real_tab)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, real_tab, label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+    @classmethod
+    def _title_font(cls) -> QFont:
+        """Shared font for the application title"""
+        if cls._title_font_cache is None:
+            cls._title_font_cache = QFont("Segoe UI", 18, QFont.Weight.Bold)
+        return cls._title_font_cache
+    
+    @classmethod
+    def _subtitle_font(cls) -> QFont:
+        """Shared font for the application subtitle"""
+        if cls._subtitle_font_cache is None:
+            cls._subtitle_font_cache = QFont("Segoe UI", 10)
+        return cls._subtitle_font_cache
+    
     def create_header(self):
         """Create application header"""
         header_widget = QWidget()
@@ -95,14 +316,12 @@ class MainWindow(QMainWindow):
         # Title
         title = QLabel("Planificateur de Quarts de Travail")
         title.setObjectName("headerTitle")
-        title_font = QFont("Segoe UI", 18, QFont.Weight.Bold)
-        title.setFont(title_font)
+        title.setFont(self._title_font())
         
         # Subtitle
         subtitle = QLabel("Optimisation intelligente des horaires du personnel avec Gurobi")
         subtitle.setObjectName("headerSubtitle")
-        subtitle_font = QFont("Segoe UI", 10)
-        subtitle.setFont(subtitle_font)
+        subtitle.setFont(self._subtitle_font())
         
         # Layout for title and subtitle
         title_layout = QVBoxLayout()
@@ -125,75 +344,33 @@ class MainWindow(QMainWindow):
         
     def create_menu_bar(self):
         """Create application menu bar"""
-        menubar = self.menuBar()
-        
-        # File menu
-        file_menu = menubar.addMenu("&Fichier")
-        
-        new_action = QAction("Nouveau projet", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self.new_project)
-        file_menu.addAction(new_action)
-        
-        open_action = QAction("Ouvrir...", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self.open_project)
-        file_menu.addAction(open_action)
-        
-        save_action = QAction("Enregistrer", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self.save_project)
-        file_menu.addAction(save_action)
-        
-        save_as_action = QAction("Enregistrer sous...", self)
-        save_as_action.setShortcut("Ctrl+Shift+S")
-        save_as_action.triggered.connect(self.save_project_as)
-        file_menu.addAction(save_as_action)
-        
-        file_menu.addSeparator()
-        
-        # Sample data submenu
-        sample_menu = file_menu.addMenu("Charger exemple")
-        
-        retail_action = QAction("Magasin détail (standard)", self)
-        retail_action.triggered.connect(lambda: self.load_sample_data("retail"))
-        sample_menu.addAction(retail_action)
-        
-        restaurant_action = QAction("Restaurant", self)
-        restaurant_action.triggered.connect(lambda: self.load_sample_data("restaurant"))
-        sample_menu.addAction(restaurant_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("Quitter", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit menu
-        edit_menu = menubar.addMenu("&Édition")
-        
-        clear_action = QAction("Effacer toutes les données", self)
-        clear_action.triggered.connect(self.clear_all_data)
-        edit_menu.addAction(clear_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu("&Aide")
-        
-        guide_action = QAction("Guide d'utilisation", self)
-        guide_action.triggered.connect(self.show_user_guide)
-        help_menu.addAction(guide_action)
-        
-        about_action = QAction("À propos", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        self._build_menus(self.menuBar(), _MENUS)
+    
+    def _build_menus(self, parent, spec):
+        """Add the menus described by a _MENUS-style table to parent"""
+        for title, entries in spec:
+            menu = parent.addMenu(title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                elif isinstance(entry[1], tuple):
+                    # (title, entries) describes a submenu
+                    self._build_menus(menu, (entry,))
+                else:
+                    label, shortcut, handler = entry
+                    action = QAction(label, self)
+                    if shortcut:
+                        action.setShortcut(shortcut)
+                    action.triggered.connect(getattr(self, handler))
+                    menu.addAction(action)
         
     def create_status_bar(self):
         """Create status bar"""
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Prêt")
+        self._show_status("Prêt")
         
+    @pyqtSlot()
     def toggle_theme(self):
         """Toggle between light and dark theme"""
         self.is_dark_theme = not self.is_dark_theme
@@ -202,50 +379,69 @@ class MainWindow(QMainWindow):
             if self.is_dark_theme:
                 self.theme_btn.setText("☀️ Mode Clair")
                 # Load dark theme
-                qss_file = self._get_resource_path('style_dark.qss')
-                self._load_stylesheet(qss_file)
-                self.status_bar.showMessage("Thème sombre activé")
+                self._load_stylesheet(self._dark_qss)
+                self._show_status("Thème sombre activé")
             else:
                 self.theme_btn.setText("🌙 Mode Sombre")
                 # Load light theme
-                qss_file = self._get_resource_path('style.qss')
-                self._load_stylesheet(qss_file)
-                self.status_bar.showMessage("Thème clair activé")
+                self._load_stylesheet(self._light_qss)
+                self._show_status("Thème clair activé")
         except Exception as e:
             QMessageBox.warning(self, "Erreur de thème",
                               f"Impossible de charger le thème:\n{str(e)}")
     
     def _get_resource_path(self, resource_name: str) -> str:
         """Get the absolute path to a resource file"""
-        # Get the directory where main.py is located
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(current_dir)  # Go up from views/ to root
-        resource_path = os.path.join(project_root, 'resources', resource_name)
-        return resource_path
+        return os.path.join(_RESOURCES_DIR, resource_name)
+    
+    def _read_stylesheet(self, stylesheet_path: str) -> str:
+        """Return the QSS text for a path, reading it from disk only once"""
+        stylesheet = self._qss_cache.get(stylesheet_path)
+        if stylesheet is None:
+            if not os.path.exists(stylesheet_path):
+                raise FileNotFoundError(f"Stylesheet not found: {stylesheet_path}")
+            
+            with open(stylesheet_path, 'r', encoding='utf-8') as f:
+                stylesheet = f.read()
+            self._qss_cache[stylesheet_path] = stylesheet
+        return stylesheet
     
     def _load_stylesheet(self, stylesheet_path: str):
         """Load and apply a QSS stylesheet"""
-        if not os.path.exists(stylesheet_path):
-            raise FileNotFoundError(f"Stylesheet not found: {stylesheet_path}")
-        
-        with open(stylesheet_path, 'r', encoding='utf-8') as f:
-            stylesheet = f.read()
-        
-        QApplication.instance().setStyleSheet(stylesheet)
+        QApplication.instance().setStyleSheet(self._read_stylesheet(stylesheet_path))
+    
+    @pyqtSlot()
+    def _preload_dark(self):
+        """Warm the stylesheet cache with the dark theme"""
+        try:
+            self._read_stylesheet(self._dark_qss)
+        except Exception as e:
+            print(f"Warning: Could not load theme: {e}")
 
     def _wrap_scroll(self, widget: QWidget) -> QWidget:
         """Wrap a tab widget in a scroll area to allow vertical scrolling"""
-        from PyQt6.QtWidgets import QScrollArea
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QScrollArea.Shape.NoFrame)
         scroll.setWidget(widget)
         return scroll
     
+    @pyqtSlot()
     def on_data_changed(self):
         """Handle data changes"""
+        self._status_timer.start()
+    
+    def _show_status(self, message: str, timeout: int = 0):
+        """Show an explicit status message; it replaces a pending data-changed one"""
+        self._status_timer.stop()
+        self.status_bar.showMessage(message, timeout)
+    
+    @pyqtSlot()
+    def _show_data_changed(self):
+        """Show the data-changed status once a burst of edits settles"""
         self.status_bar.showMessage("Données modifiées", 3000)
     
+    @pyqtSlot()
     def new_project(self):
         """Create new project"""
         reply = QMessageBox.question(
@@ -256,8 +452,10 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.clear_all_data()
-            self.status_bar.showMessage("Nouveau projet créé")
+            self.current_filename = None
+            self._show_status("Nouveau projet créé")
     
+    @pyqtSlot()
     def open_project(self):
         """Open saved project"""
         filename, _ = QFileDialog.getOpenFileName(
@@ -266,40 +464,72 @@ class MainWindow(QMainWindow):
         )
         
         if filename:
+            self._show_status(f"Chargement du projet: {filename}...")
+            self._start_file_task(filename, _read_project_file,
+                                  self._on_project_loaded, self._on_open_failed)
+    
+    @pyqtSlot(str, object)
+    def _on_project_loaded(self, filename: str, data: dict):
+        """Apply a project read by the file worker"""
+        try:
+            # Load employee data
+            self.employee_manager.clear()
+            self.employee_manager.add_many(data.get('employees', []))
+            
+            # Load demand data
+            self.demand_profile = DemandProfile.from_dict(data.get('demand', {}))
+            
+            # Update built tabs with new data (unbuilt tabs read it on
+            # creation); repaint once after every tab has been refreshed
+            self.tabs.setUpdatesEnabled(False)
             try:
-                with open(filename, 'rb') as f:
-                    data = pickle.load(f)
-                
-                # Load employee data
-                self.employee_manager.clear()
-                for emp_data in data.get('employees', []):
-                    self.employee_manager.add_employee(**emp_data)
-                
-                # Load demand data
-                self.demand_profile = DemandProfile.from_dict(data.get('demand', {}))
-                
-                # Update tabs with new data
-                self.demand_tab.demand_profile = self.demand_profile
-                self.schedule_tab.demand_profile = self.demand_profile
+                if self.demand_tab is not None:
+                    self.demand_tab.demand_profile = self.demand_profile
+                if self.schedule_tab is not None:
+                    self.schedule_tab.demand_profile = self.demand_profile
                 
                 # Refresh all tabs to display new data
-                self.employees_tab.refresh_table()
-                self.demand_tab.load_demand_data()
-                
-                self.status_bar.showMessage(f"Projet chargé: {filename}")
-                QMessageBox.information(self, "Succès", "Projet chargé avec succès!")
-                
-            except Exception as e:
-                QMessageBox.critical(self, "Erreur", 
-                                   f"Impossible d'ouvrir le projet:\n{str(e)}")
+                if self.employees_tab is not None:
+                    self.employees_tab.refresh_table()
+                if self.demand_tab is not None:
+                    self.demand_tab.load_demand_data()
+            finally:
+                self.tabs.setUpdatesEnabled(True)
+            
+            self.current_filename = filename
+            self._show_status(f"Projet chargé: {filename}")
+            QMessageBox.information(self, "Succès", "Projet chargé avec succès!")
+            
+        except Exception as e:
+            self._on_open_failed(filename, str(e))
+    
+    @pyqtSlot(str, str)
+    def _on_open_failed(self, filename: str, error: str):
+        """Report a project that could not be opened"""
+        self._show_status("Prêt")
+        QMessageBox.critical(self, "Erreur", 
+                           f"Impossible d'ouvrir le projet:\n{error}")
+    
+    def _start_file_task(self, filename: str, func, on_done, on_failed, *args, pool=None):
+        """Run func(filename, *args) on a thread pool (default: the global one) and report back here"""
+        # The signal object lives in the GUI thread so the results are
+        # delivered through queued connections
+        signals = _FileTaskSignals(self)
+        signals.finished.connect(on_done)
+        signals.failed.connect(on_failed)
+        signals.finished.connect(signals.deleteLater)
+        signals.failed.connect(signals.deleteLater)
+        (pool or QThreadPool.globalInstance()).start(_FileTask(signals, filename, func, *args))
     
+    @pyqtSlot()
     def save_project(self):
         """Save project with current filename"""
-        if not hasattr(self, 'current_filename'):
+        if self.current_filename is None:
             self.save_project_as()
         else:
             self._save_to_file(self.current_filename)
     
+    @pyqtSlot()
     def save_project_as(self):
         """Save project with new filename"""
         filename, _ = QFileDialog.getSaveFileName(
@@ -313,121 +543,86 @@ class MainWindow(QMainWindow):
     
     def _save_to_file(self, filename: str):
         """Internal save method"""
-        try:
-            data = {
-                'employees': [emp.to_dict() for emp in 
-                            self.employee_manager.get_all_employees()],
-                'demand': self.demand_profile.to_dict()
-            }
-            
-            with open(filename, 'wb') as f:
-                pickle.dump(data, f)
-            
-            self.status_bar.showMessage(f"Projet sauvegardé: {filename}")
-            QMessageBox.information(self, "Succès", "Projet sauvegardé avec succès!")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Erreur",
-                               f"Impossible de sauvegarder:\n{str(e)}")
+        # Snapshot the models here (reused if nothing changed since the last
+        # save); only serialization and disk I/O run on the worker thread
+        data = {
+            'employees': self.employee_manager.to_dict_cached(),
+            'demand': self.demand_profile.to_dict_cached()
+        }
+        
+        self._show_status(f"Sauvegarde du projet: {filename}...")
+        self._start_file_task(filename, _write_project_file,
+                              self._on_project_saved, self._on_save_failed, data,
+                              pool=self._save_pool)
+    
+    @pyqtSlot(str, object)
+    def _on_project_saved(self, filename: str, _result):
+        """Report a completed save"""
+        self._show_status(f"Projet sauvegardé: {filename}")
+        QMessageBox.information(self, "Succès", "Projet sauvegardé avec succès!")
+    
+    @pyqtSlot(str, str)
+    def _on_save_failed(self, filename: str, error: str):
+        """Report a save that could not be written"""
+        self._show_status("Prêt")
+        QMessageBox.critical(self, "Erreur",
+                           f"Impossible de sauvegarder:\n{error}")
     
+    def closeEvent(self, event):
+        """Let pending project writes finish before the window closes"""
+        self._save_pool.waitForDone()
+        super().closeEvent(event)
+    
+    @pyqtSlot()
     def clear_all_data(self):
         """Clear all employee and demand data"""
         self.employee_manager.clear()
         self.demand_profile = DemandProfile()
-        self.employees_tab.refresh_table()
-        self.demand_tab.reset_demand()
-        self.status_bar.showMessage("Données effacées")
+        if self.employees_tab is not None:
+            self.employees_tab.refresh_table()
+        if self.demand_tab is not None:
+            self.demand_tab.reset_demand()
+        self._show_status("Données effacées")
     
     def load_sample_data(self, data_type: str = "retail"):
         """Load sample data for testing"""
         # Clear existing data
         self.employee_manager.clear()
         
-        if data_type == "retail":
-            # Sample retail employees
-            self.employee_manager.add_employee(
-                "Marie Dubois", 18.50, max_hours_per_day=8,
-                availability=set(range(8, 20)), skills=["Caisse", "Service client"]
-            )
-            self.employee_manager.add_employee(
-                "Jean Martin", 16.00, max_hours_per_day=6,
-                availability=set(range(9, 18)), skills=["Stock"]
-            )
-            self.employee_manager.add_employee(
-                "Sophie Leroux", 22.00, max_hours_per_day=8,
-                availability=set(range(8, 20)), skills=["Manager", "Caisse"]
-            )
-            self.employee_manager.add_employee(
-                "Pierre Blanc", 15.50, max_hours_per_day=4,
-                availability=set(range(14, 20)), skills=["Stock", "Merchandising"]
-            )
-            self.employee_manager.add_employee(
-                "Emma Petit", 17.00, max_hours_per_day=8,
-                availability=set(range(8, 17)), skills=["Service client", "Caisse"]
-            )
-            
-            # Sample demand - bimodal pattern
-            self.demand_profile.apply_pattern("bimodal")
-            
-        elif data_type == "restaurant":
-            # Restaurant staff
-            self.employee_manager.add_employee(
-                "Chef Antoine", 25.00, max_hours_per_day=10,
-                availability=set(range(10, 22)), skills=["Cuisine"]
-            )
-            self.employee_manager.add_employee(
-                "Serveur Lucas", 14.00, max_hours_per_day=8,
-                availability=set(range(11, 23)), skills=["Service"]
-            )
-            
-            # Lunch and dinner peaks
+        employees = _SAMPLE_EMPLOYEES.get(data_type, ())
+        self.employee_manager.add_many(
+            {'name': name, 'hourly_rate': rate, 'max_hours_per_day': max_hours,
+             'availability': availability, 'skills': skills}
+            for name, rate, max_hours, availability, skills in employees
+        )
+        
+        # Sample demand - bimodal pattern (lunch and dinner peaks)
+        if employees:
             self.demand_profile.apply_pattern("bimodal")
         
         # Refresh UI
-        self.employees_tab.refresh_table()
-        self.demand_tab.load_demand_data()
-        self.status_bar.showMessage(f"Données exemple '{data_type}' chargées")
+        if self.employees_tab is not None:
+            self.employees_tab.refresh_table()
+        if self.demand_tab is not None:
+            self.demand_tab.load_demand_data()
+        self._show_status(f"Données exemple '{data_type}' chargées")
     
+    @pyqtSlot()
+    def _load_retail(self):
+        """Load the retail sample data"""
+        self.load_sample_data("retail")
+    
+    @pyqtSlot()
+    def _load_restaurant(self):
+        """Load the restaurant sample data"""
+        self.load_sample_data("restaurant")
+    
+    @pyqtSlot()
     def show_user_guide(self):
         """Show user guide"""
-        guide_text = """
-        <h2>Guide d'utilisation</h2>
-        
-        <h3>1. Employés</h3>
-        <p>Ajoutez vos employés avec leurs taux horaires, disponibilités et compétences.</p>
-        
-        <h3>2. Demande</h3>
-        <p>Configurez la demande horaire attendue (nombre de clients par heure).</p>
-        
-        <h3>3. Planification</h3>
-        <p>Cliquez sur "Optimiser" pour générer le planning optimal avec Gurobi.</p>
-        
-        <h3>Conseils</h3>
-        <ul>
-        <li>Définissez au moins 3-4 employés pour de bons résultats</li>
-        <li>Assurez-vous que les disponibilités couvrent les heures d'ouverture</li>
-        <li>Utilisez les motifs prédéfinis pour la demande</li>
-        </ul>
-        """
-        
-        QMessageBox.about(self, "Guide d'utilisation", guide_text)
+        QMessageBox.about(self, "Guide d'utilisation", _USER_GUIDE_HTML)
     
+    @pyqtSlot()
     def show_about(self):
         """Show about dialog"""
-        QMessageBox.about(self, "À propos",
-                         "<h3>Planificateur de Quarts v1.0</h3>"
-                         "<p>Application d'optimisation des horaires de travail pour le commerce de détail</p>"
-                         "<p><b>Technologies:</b></p>"
-                         "<ul>"
-                         "<li>PyQt6 - Interface graphique</li>"
-                         "<li>Gurobi - Optimisation mathématique</li>"
-                         "<li>Python 3.8+</li>"
-                         "</ul>"
-                         "<p><b>Fonctionnalités:</b></p>"
-                         "<ul>"
-                         "<li>Gestion des employés et disponibilités</li>"
-                         "<li>Configuration de la demande horaire</li>"
-                         "<li>Optimisation automatique avec contraintes</li>"
-                         "<li>Visualisation Gantt des horaires</li>"
-                         "</ul>"
-                         "<p>aziz haddadi © 2025</p>")
\ No newline at end of file
+        QMessageBox.about(self, "À propos", _ABOUT_HTML)
\ No newline at end of file
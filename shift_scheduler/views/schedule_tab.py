@@ -8,51 +8,120 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QSpinBox, QCheckBox, QProgressBar, QTextEdit,
                              QTableWidget, QTableWidgetItem, QMessageBox,
                              QHeaderView, QScrollArea, QAbstractScrollArea)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QColor
-from models.optimization import ShiftScheduler, ScheduleResult
+from PyQt6.QtCore import (Qt, QPointF, QRect, QSize, QObject, QRunnable,
+                          QThreadPool, pyqtSignal)
+from PyQt6.QtGui import (QFont, QColor, QPainter, QPen, QBrush, QStaticText,
+                         QTransform, QRegion, QPixmap)
+import numpy as np
+from models.optimization import ShiftScheduler, ScheduleResult, BuildParams
 from models.employee import EmployeeManager
 from models.demand import DemandProfile
 
 
-class OptimizationThread(QThread):
-    """Thread for running optimization without freezing UI"""
-    
+class OptimizationSignals(QObject):
+    """Signals of an OptimizationRunnable"""
     finished = pyqtSignal(object)  # Emits ScheduleResult
     progress = pyqtSignal(str)
     error = pyqtSignal(str)
+
+
+class OptimizationRunnable(QRunnable):
+    """Runs the optimization on the global thread pool without freezing UI"""
     
-    def __init__(self, scheduler, params):
+    def __init__(self, signals: OptimizationSignals, scheduler,
+                 build_params: BuildParams, time_limit: int = 60):
         super().__init__()
+        self.signals = signals
         self.scheduler = scheduler
-        self.params = params
+        self.build_params = build_params
+        self.time_limit = time_limit
     
     def run(self):
         try:
-            self.progress.emit("Construction du modèle...")
-            # Only pass model-related parameters; keep solve-only options separate
-            build_params = {k: v for k, v in self.params.items() if k != 'time_limit'}
-            self.scheduler.build_model(**build_params)
+            self.signals.progress.emit("Construction du modèle...")
+            self.scheduler.build_model(self.build_params)
             
-            self.progress.emit("Optimisation en cours...")
-            result = self.scheduler.solve(time_limit=self.params.get('time_limit', 60))
+            self.signals.progress.emit("Optimisation en cours...")
+            result = self.scheduler.solve(time_limit=self.time_limit)
             
-            self.progress.emit("Terminé!")
-            self.finished.emit(result)
+            self.signals.progress.emit("Terminé!")
+            self.signals.finished.emit(result)
             
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class ScheduleGanttChart(QWidget):
     """Gantt chart visualization of schedule"""
     
+    # Painted with the raster engine on purpose: QOpenGLWidget fails to get
+    # a GL context on some machines (remote desktop, VMs, offscreen) and
+    # redraws its whole framebuffer, losing the per-row partial repaints.
+    
+    MARGIN_LEFT = 150
+    MARGIN_TOP = 40
+    MARGIN_BOTTOM = 30
+    MARGIN_RIGHT = 20
+    
     def __init__(self):
         super().__init__()
         self.schedule_result = None
         self.employee_manager = None
         self.demand_profile = None
         self.setMinimumHeight(300)
+        
+        # Paint resources, reused by every paintEvent
+        self._pen_title = QPen(QColor("#2d3748"))
+        self._pen_axis = QPen(QColor("#718096"))
+        self._pen_shift = QPen(QColor("#5568d3"), 2)
+        self._pen_white = QPen(QColor("white"))
+        self._brush_shift = QBrush(QColor("#667eea"))
+        
+        # Fonts derive from the widget font, so they are rebuilt if it changes
+        self._font_base = None
+        self._font_title = None
+        self._font_axis = None
+        self._font_bold = None
+        
+        # Rows to draw and the store hours they were laid out for, from set_data
+        self._rows = []
+        self._hours_key = None
+        
+        # Rendered chart, and the part of it that set_result_incremental made stale
+        self._cache = None
+        self._cache_pending = QRegion()
+        
+        # QStaticText labels keyed by hour and by (start, end)
+        self._hour_labels = {}
+        self._shift_labels = {}
+    
+    def _update_fonts(self) -> bool:
+        """Build the title, axis and bold label fonts from the widget font
+        
+        Returns True if they were rebuilt.
+        """
+        base = self.font()
+        if base == self._font_base:
+            return False
+        self._font_base = QFont(base)
+        
+        self._font_title = QFont(base)
+        self._font_title.setPointSize(12)
+        self._font_title.setBold(True)
+        
+        self._font_axis = QFont(base)
+        self._font_axis.setPointSize(9)
+        self._font_axis.setBold(False)
+        
+        self._font_bold = QFont(self._font_axis)
+        self._font_bold.setBold(True)
+        
+        # Lay the cached labels out again for the new fonts
+        for label in self._hour_labels.values():
+            label.prepare(QTransform(), self._font_axis)
+        for label in self._shift_labels.values():
+            label.prepare(QTransform(), self._font_bold)
+        return True
     
     def set_data(self, result: ScheduleResult, emp_mgr: EmployeeManager, 
                  demand: DemandProfile):
@@ -60,39 +129,167 @@ class ScheduleGanttChart(QWidget):
         self.schedule_result = result
         self.employee_manager = emp_mgr
         self.demand_profile = demand
+        
+        # One (employee or None, shifts) row per employee with shifts, so
+        # paints do not rebuild the lookup
+        self._rows = self._build_rows(result, emp_mgr)
+        self._hours_key = (demand.store_open_hour, demand.store_close_hour)
+        self._cache = None
+        
+        # Pre-shaped axis and shift labels; paintEvent adds any it is missing
+        self._hour_labels = {
+            hour: self._make_static_text(f"{hour}h", self._font_axis)
+            for hour in range(demand.store_open_hour, demand.store_close_hour + 1)
+        }
+        self._shift_labels = {
+            (start, end): self._make_static_text(f"{start}:00-{end}:00", self._font_bold)
+            for shifts in result.schedule.values() for start, end in shifts
+        }
         self.update()
     
+    def set_result_incremental(self, result: ScheduleResult):
+        """Show a new result, repainting only the rows whose shifts changed
+        
+        Falls back to a full set_data when the rows themselves (employees,
+        names, count) or the store hours differ from what is displayed.
+        """
+        demand = self.demand_profile
+        rows = self._build_rows(result, self.employee_manager)
+        old_rows = self._rows
+        
+        if (self.schedule_result is None or len(rows) != len(old_rows)
+                or self._hours_key != (demand.store_open_hour, demand.store_close_hour)
+                or any(self._row_key(new) != self._row_key(old)
+                       for new, old in zip(rows, old_rows))):
+            self.set_data(result, self.employee_manager, demand)
+            return
+        
+        self.schedule_result = result
+        self._rows = rows
+        dirty = QRegion()
+        for i, ((_, shifts), (_, old_shifts)) in enumerate(zip(rows, old_rows)):
+            if shifts != old_shifts:
+                for start, end in shifts:
+                    if (start, end) not in self._shift_labels:
+                        self._shift_labels[(start, end)] = self._make_static_text(
+                            f"{start}:00-{end}:00", self._font_bold)
+                dirty += self._row_rect(i, len(rows))
+        if not dirty.isEmpty():
+            self._cache_pending += dirty
+            self.update(dirty)
+    
+    @staticmethod
+    def _build_rows(result: ScheduleResult, emp_mgr: EmployeeManager):
+        """(employee or None, shifts) for each employee with shifts"""
+        emp_dict = {emp.id: emp for emp in emp_mgr.get_all_employees()}
+        return [(emp_dict.get(emp_id), shifts)
+                for emp_id, shifts in result.schedule.items() if shifts]
+    
+    @staticmethod
+    def _row_key(row):
+        emp = row[0]
+        return (emp.id, emp.name) if emp else None
+    
+    def _row_rect(self, index: int, n_rows: int) -> QRect:
+        """Widget area painted by row index: its shift bars and name label"""
+        chart_height = self.height() - self.MARGIN_TOP - self.MARGIN_BOTTOM
+        row_height = chart_height / max(n_rows, 1)
+        y = self.MARGIN_TOP + index * row_height
+        # The name box is 20 px tall around the row centre and can overhang
+        # short rows; pad for pen width and int truncation
+        top = int(min(y, y + row_height / 2 - 10)) - 2
+        bottom = int(max(y + row_height, y + row_height / 2 + 10)) + 2
+        return QRect(0, top, self.width(), bottom - top + 1)
+    
+    @staticmethod
+    def _make_static_text(text: str, font: QFont) -> QStaticText:
+        """Plain-text QStaticText, laid out for font once fonts exist"""
+        static = QStaticText(text)
+        static.setTextFormat(Qt.TextFormat.PlainText)
+        if font is not None:
+            static.prepare(QTransform(), font)
+        return static
+    
+    @staticmethod
+    def _draw_centered(painter: QPainter, x: int, y: int, w: int, h: int,
+                       static: QStaticText):
+        """Draw static text centred in a box, clipped to it like drawText"""
+        size = static.size()
+        pos = QPointF(x + (w - size.width()) / 2, y + (h - size.height()) / 2)
+        if size.width() <= w and size.height() <= h:
+            painter.drawStaticText(pos, static)
+        else:
+            painter.save()
+            painter.setClipRect(x, y, w, h, Qt.ClipOperation.IntersectClip)
+            painter.drawStaticText(pos, static)
+            painter.restore()
+    
+    def resizeEvent(self, event):
+        self._cache = None
+        super().resizeEvent(event)
+    
     def paintEvent(self, event):
         """Draw Gantt chart"""
         if not self.schedule_result or not self.employee_manager:
             return
         
-        from PyQt6.QtGui import QPainter, QPen, QBrush
+        if not self._rows:
+            painter = QPainter(self)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.drawText(self.width()//2 - 100, self.height()//2, 
+                           "Aucun horaire à afficher")
+            return
         
-        painter = QPainter(self)
+        # The chart is drawn once into a pixmap and blitted on later paints;
+        # only a resize, new data or a font change redraws all of it
+        if self._update_fonts():
+            self._cache = None
+        dpr = self.devicePixelRatioF()
+        target = QSize(round(self.width() * dpr), round(self.height() * dpr))
+        if (self._cache is None or self._cache.size() != target
+                or self._cache.devicePixelRatioF() != dpr):
+            cache = QPixmap(target)
+            cache.setDevicePixelRatio(dpr)
+            cache.fill(Qt.GlobalColor.transparent)
+            self._render_cache(cache, None)
+            self._cache = cache
+        elif not self._cache_pending.isEmpty():
+            self._render_cache(self._cache, self._cache_pending)
+        self._cache_pending = QRegion()
+        
+        QPainter(self).drawPixmap(0, 0, self._cache)
+    
+    def _render_cache(self, cache: QPixmap, region):
+        """Draw the chart into cache, or only redraw region of it"""
+        painter = QPainter(cache)
+        if region is None:
+            region = QRegion(self.rect())
+        else:
+            # Clear the stale area, then redraw what crosses it
+            painter.setClipRegion(region)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
+            painter.fillRect(region.boundingRect(), Qt.GlobalColor.transparent)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        self._draw_chart(painter, region)
+        painter.end()
+    
+    def _draw_chart(self, painter: QPainter, dirty: QRegion):
+        """Draw the title, time axis and the rows intersecting dirty"""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         width = self.width()
         height = self.height()
-        margin_left = 150
-        margin_top = 40
-        margin_bottom = 30
-        margin_right = 20
+        margin_left = self.MARGIN_LEFT
+        margin_top = self.MARGIN_TOP
+        margin_bottom = self.MARGIN_BOTTOM
+        margin_right = self.MARGIN_RIGHT
         
         chart_width = width - margin_left - margin_right
         chart_height = height - margin_top - margin_bottom
         
-        # Get employees with shifts
-        emp_dict = {emp.id: emp for emp in self.employee_manager.get_all_employees()}
-        scheduled_emps = [emp_id for emp_id in self.schedule_result.schedule 
-                         if self.schedule_result.schedule[emp_id]]
-        
-        if not scheduled_emps:
-            painter.drawText(width//2 - 100, height//2, 
-                           "Aucun horaire à afficher")
-            return
-        
-        row_height = chart_height / max(len(scheduled_emps), 1)
+        # Employees with shifts
+        rows = self._rows
+        row_height = chart_height / max(len(rows), 1)
         
         # Time range
         open_h = self.demand_profile.store_open_hour
@@ -101,71 +298,69 @@ class ScheduleGanttChart(QWidget):
         hour_width = chart_width / hours_range
         
         # Draw title
-        painter.setPen(QColor("#2d3748"))
-        font = painter.font()
-        font.setPointSize(12)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setPen(self._pen_title)
+        painter.setFont(self._font_title)
         painter.drawText(0, 10, width, 30, Qt.AlignmentFlag.AlignCenter,
                         "Planning Optimisé")
         
         # Draw time axis
-        font.setPointSize(9)
-        font.setBold(False)
-        painter.setFont(font)
-        painter.setPen(QColor("#718096"))
+        painter.setFont(self._font_axis)
+        painter.setPen(self._pen_axis)
         
         for i, hour in enumerate(range(open_h, close_h + 1)):
             x = margin_left + i * hour_width
             painter.drawLine(int(x), margin_top, int(x), height - margin_bottom)
-            painter.drawText(int(x) - 15, height - margin_bottom + 5, 30, 20,
-                           Qt.AlignmentFlag.AlignCenter, f"{hour}h")
-        
-        # Draw employee rows
-        for i, emp_id in enumerate(scheduled_emps):
+            label = self._hour_labels.get(hour)
+            if label is None:
+                label = self._make_static_text(f"{hour}h", self._font_axis)
+                self._hour_labels[hour] = label
+            self._draw_centered(painter, int(x) - 15, height - margin_bottom + 5,
+                                30, 20, label)
+        
+        # Draw employee rows, skipping those outside the repainted region
+        for i, (emp, shifts) in enumerate(rows):
+            if not dirty.intersects(self._row_rect(i, len(rows))):
+                continue
             y = margin_top + i * row_height
             
             # Employee name
-            emp = emp_dict.get(emp_id)
             if emp:
-                painter.setPen(QColor("#2d3748"))
-                font.setBold(True)
-                painter.setFont(font)
+                painter.setPen(self._pen_title)
+                painter.setFont(self._font_bold)
                 painter.drawText(5, int(y + row_height/2 - 10), margin_left - 10, 20,
                                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
                                emp.name)
-                font.setBold(False)
-                painter.setFont(font)
             
             # Draw shifts
-            shifts = self.schedule_result.schedule[emp_id]
             for start, end in shifts:
                 x_start = margin_left + (start - open_h) * hour_width
                 x_end = margin_left + (end - open_h) * hour_width
                 shift_width = x_end - x_start
                 
                 # Shift bar
-                painter.setBrush(QBrush(QColor("#667eea")))
-                painter.setPen(QPen(QColor("#5568d3"), 2))
+                painter.setBrush(self._brush_shift)
+                painter.setPen(self._pen_shift)
                 painter.drawRoundedRect(int(x_start + 2), int(y + 5),
                                        int(shift_width - 4), int(row_height - 10),
                                        5, 5)
                 
                 # Shift time text
-                painter.setPen(QColor("white"))
-                font.setBold(True)
-                painter.setFont(font)
-                shift_text = f"{start}:00-{end}:00"
-                painter.drawText(int(x_start), int(y + 5), 
-                               int(shift_width), int(row_height - 10),
-                               Qt.AlignmentFlag.AlignCenter, shift_text)
-                font.setBold(False)
-                painter.setFont(font)
+                painter.setPen(self._pen_white)
+                painter.setFont(self._font_bold)
+                label = self._shift_labels.get((start, end))
+                if label is None:
+                    label = self._make_static_text(f"{start}:00-{end}:00", self._font_bold)
+                    self._shift_labels[(start, end)] = label
+                self._draw_centered(painter, int(x_start), int(y + 5),
+                                    int(shift_width), int(row_height - 10), label)
 
 
 class ScheduleTab(QWidget):
     """Main schedule optimization tab"""
     
+    # Settings, Gantt chart and summary table stack taller than most screens
+    needs_scroll = True
+    
     def __init__(self, employee_manager: EmployeeManager, 
                  demand_profile: DemandProfile):
         super().__init__()
@@ -173,7 +368,6 @@ class ScheduleTab(QWidget):
         self.demand_profile = demand_profile
         self.scheduler = None
         self.result = None
-        self.optimization_thread = None
         self.init_ui()
     
     def init_ui(self):
@@ -315,24 +509,29 @@ class ScheduleTab(QWidget):
             "Maximiser la couverture": "maximize_coverage"
         }
         
-        params = {
-            'objective': objective_map[self.objective_combo.currentText()],
-            'min_shift_length': self.min_shift_spin.value(),
-            'max_shift_length': self.max_shift_spin.value(),
-            'allow_overtime': self.overtime_check.isChecked(),
-            'time_limit': self.time_limit_spin.value()
-        }
+        # Model options and the solve-only time limit are kept separate
+        build_params = BuildParams(
+            objective=objective_map[self.objective_combo.currentText()],
+            min_shift_length=self.min_shift_spin.value(),
+            max_shift_length=self.max_shift_spin.value(),
+            allow_overtime=self.overtime_check.isChecked()
+        )
+        time_limit = self.time_limit_spin.value()
         
         # Create scheduler
         employees = self.employee_manager.get_all_employees()
         self.scheduler = ShiftScheduler(employees, self.demand_profile)
         
-        # Run in thread
-        self.optimization_thread = OptimizationThread(self.scheduler, params)
-        self.optimization_thread.finished.connect(self.on_optimization_finished)
-        self.optimization_thread.progress.connect(self.on_optimization_progress)
-        self.optimization_thread.error.connect(self.on_optimization_error)
-        self.optimization_thread.start()
+        # Run on a pooled worker thread; the signals object lives in the GUI
+        # thread so the handlers below run there
+        signals = OptimizationSignals(self)
+        signals.finished.connect(self.on_optimization_finished)
+        signals.progress.connect(self.on_optimization_progress)
+        signals.error.connect(self.on_optimization_error)
+        signals.finished.connect(signals.deleteLater)
+        signals.error.connect(signals.deleteLater)
+        QThreadPool.globalInstance().start(
+            OptimizationRunnable(signals, self.scheduler, build_params, time_limit))
     
     def on_optimization_progress(self, message: str):
         """Update progress message"""
@@ -375,35 +574,50 @@ class ScheduleTab(QWidget):
     
     def update_gantt_chart(self):
         """Update Gantt chart with results"""
-        self.gantt_chart.set_data(self.result, self.employee_manager, 
-                                 self.demand_profile)
+        if (self.gantt_chart.schedule_result is not None
+                and self.gantt_chart.demand_profile is self.demand_profile):
+            # Re-optimisation: only rows whose shifts changed are repainted
+            self.gantt_chart.set_result_incremental(self.result)
+        else:
+            self.gantt_chart.set_data(self.result, self.employee_manager, 
+                                     self.demand_profile)
     
     def update_summary_table(self):
         """Update summary table with employee assignments"""
-        self.summary_table.setRowCount(0)
-        
         emp_dict = {emp.id: emp for emp in self.employee_manager.get_all_employees()}
+        total_hours = self.result.total_hours
+        rows = [(emp_dict[emp_id], shifts, total_hours[emp_id])
+                for emp_id, shifts in self.result.schedule.items()
+                if shifts and emp_id in emp_dict]
+        shift_strs = [", ".join([f"{s}:00-{e}:00" for s, e in shifts])
+                      for _, shifts, _ in rows]
+        
+        # Size the table once and fill cells by index, with repaints and
+        # signals suspended
+        table = self.summary_table
+        sorting_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setRowCount(len(rows))
+        
+        for row, ((emp, _, hours), shift_str) in enumerate(zip(rows, shift_strs)):
+            # Name
+            table.setItem(row, 0, QTableWidgetItem(emp.name))
+            
+            # Shifts
+            table.setItem(row, 1, QTableWidgetItem(shift_str))
+            
+            # Hours
+            table.setItem(row, 2, QTableWidgetItem(f"{hours}h"))
+            
+            # Cost
+            cost = hours * emp.hourly_rate
+            table.setItem(row, 3, QTableWidgetItem(f"${cost:.2f}"))
         
-        for emp_id, shifts in self.result.schedule.items():
-            if shifts and emp_id in emp_dict:
-                emp = emp_dict[emp_id]
-                row = self.summary_table.rowCount()
-                self.summary_table.insertRow(row)
-                
-                # Name
-                self.summary_table.setItem(row, 0, QTableWidgetItem(emp.name))
-                
-                # Shifts
-                shift_str = ", ".join([f"{s}:00-{e}:00" for s, e in shifts])
-                self.summary_table.setItem(row, 1, QTableWidgetItem(shift_str))
-                
-                # Hours
-                hours = self.result.total_hours[emp_id]
-                self.summary_table.setItem(row, 2, QTableWidgetItem(f"{hours}h"))
-                
-                # Cost
-                cost = hours * emp.hourly_rate
-                self.summary_table.setItem(row, 3, QTableWidgetItem(f"${cost:.2f}"))
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(sorting_enabled)
     
     def update_statistics(self):
         """Update statistics display"""
@@ -416,9 +630,12 @@ class ScheduleTab(QWidget):
         required = self.demand_profile.get_all_required_staff()
         coverage = self.result.coverage
         
-        shortage_hours = sum(1 for h in coverage if coverage[h] < required[h])
-        perfect_hours = sum(1 for h in coverage if coverage[h] == required[h])
-        surplus_hours = sum(1 for h in coverage if coverage[h] > required[h])
+        # Classify every hour in one pass: sign of (staffed - required) is
+        # -1 short, 0 perfect, +1 surplus
+        diff = np.fromiter((coverage[h] - required[h] for h in coverage),
+                           dtype=np.float64, count=len(coverage))
+        shortage_hours, perfect_hours, surplus_hours = (
+            int(n) for n in np.bincount(np.sign(diff).astype(np.intp) + 1, minlength=3))
         
         self.stats_label.setText(
             f"📊 Statistiques du Planning\n\n"